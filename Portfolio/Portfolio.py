@@ -1,5 +1,32 @@
+import functools
+
 import reflex as rx
-from .views.index import index
+from .utils.routing import use_incremental, use_multi_route
+from .utils.styles import font_preloads, font_stylesheets, static_stylesheets
+from .views.index import SECTIONS, create_section_page, index
+
+# The css stage extracts static styles into a stylesheet that Next.js bundles
+# into the hashed CSS file linked in <head>; only state-driven styles stay in
+# JS. The self-hosted webfonts join it, and the hero's faces are preloaded.
+app = rx.App(
+    stylesheets=[*static_stylesheets(), *font_stylesheets()],
+    head_components=font_preloads(),
+)
+if use_incremental():
+    # Development only: sections come from their cached modules. The build code is imported
+    # here so a normal build never loads it; build stages calling index() still build sections
+    # inline, so the images, icons and remote assets they register are collected.
+    from .build.incremental import section_module
+
+    app.add_page(functools.partial(index, build_section=section_module), route="index")
+else:
+    app.add_page(index)
 
-app = rx.App()
-app.add_page(index)
+# Optionally serve each section on its own route so Next.js splits it into its
+# own chunk; the navigation then prefetches those routes.
+if use_multi_route():
+    for section_id in SECTIONS:
+        app.add_page(
+            functools.partial(create_section_page, section_id),
+            route=f"/{section_id}",
+        )
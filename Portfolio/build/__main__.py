@@ -0,0 +1,43 @@
+import argparse
+import sys
+
+from . import (
+    assets, bundle, css, details, documents, export, fonts, github, images, medium, search, serve,
+    sprite, watch,
+)
+
+# Build stages, in the order they should run before `reflex export`.
+STAGES = {
+    "github": github,
+    "medium": medium,
+    "assets": assets,
+    "images": images,
+    "sprite": sprite,
+    "fonts": fonts,
+    "documents": documents,
+    "details": details,
+    "search": search,
+    "css": css,
+    "bundle": bundle,
+    "export": export,
+    # Long-running helpers: patch section modules as files change, preview the export.
+    "watch": watch,
+    "serve": serve,
+}
+
+
+def main(argv=None) -> int:
+    """Run a single build stage: python -m Portfolio.build <stage> [options]."""
+    parser = argparse.ArgumentParser(prog="python -m Portfolio.build")
+    subparsers = parser.add_subparsers(dest="stage", required=True)
+    for name, module in STAGES.items():
+        stage_parser = subparsers.add_parser(name, help=module.__doc__)
+        module.configure(stage_parser)
+        stage_parser.set_defaults(run=module.run)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
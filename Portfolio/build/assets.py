@@ -0,0 +1,121 @@
+"""Vendor every remote rx.image and registered script into assets/vendor under content-hashed names."""
+import mimetypes
+import sys
+import urllib.request
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlsplit
+
+from ..utils.assets import (
+    REMOTE_ASSETS,
+    RESPONSIVE_SOURCES,
+    VENDOR_DIR,
+    VENDOR_MANIFEST,
+    load_manifest,
+)
+from .common import hashed_filename, public_path, write_manifest
+
+USER_AGENT = "Mozilla/5.0 (compatible; Portfolio asset localizer)"
+REQUEST_TIMEOUT = 30
+
+
+def walk_components(component):
+    """Yield a component and all of its descendants, including both rx.cond branches."""
+    yield component
+    for child in getattr(component, "children", []):
+        yield from walk_components(child)
+
+
+def collect_image_sources(component) -> list:
+    """Collect the literal src of every rx.image in a component tree, in order."""
+    sources = []
+    for node in walk_components(component):
+        if getattr(node, "tag", None) != "img":
+            continue
+        src = getattr(getattr(node, "src", None), "_var_value", None)
+        if isinstance(src, str) and src not in sources:
+            sources.append(src)
+    return sources
+
+
+def is_remote(src: str) -> bool:
+    """Check whether an image source points to another origin."""
+    return urlsplit(src).scheme in ("http", "https")
+
+
+def fixture_path(fixtures_dir: Path, url: str) -> Path:
+    """Map a URL to its offline copy: <fixtures>/<host>/<path>, query string ignored."""
+    parts = urlsplit(url)
+    return fixtures_dir / parts.netloc / parts.path.lstrip("/")
+
+
+def fetch(url: str, fixtures_dir: Path = None, user_agent: str = USER_AGENT) -> tuple:
+    """Download a URL, or read it from the fixture directory, returning (bytes, content type)."""
+    if fixtures_dir is not None:
+        path = fixture_path(fixtures_dir, url)
+        return path.read_bytes(), mimetypes.guess_type(path.name)[0]
+
+    request = urllib.request.Request(url, headers={"User-Agent": user_agent})
+    with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+        return response.read(), response.headers.get_content_type()
+
+
+def guess_suffix(url: str, content_type: str) -> str:
+    """Pick a file extension, preferring the one in the URL path."""
+    suffix = PurePosixPath(urlsplit(url).path).suffix.lower()
+    if suffix:
+        return suffix
+    guessed = mimetypes.guess_extension(content_type or "") or ""
+    return ".jpg" if guessed == ".jpe" else guessed
+
+
+def vendor_image(url: str, fixtures_dir: Path = None) -> str:
+    """Store one remote image under assets/vendor and return its public path."""
+    data, content_type = fetch(url, fixtures_dir)
+    suffix = guess_suffix(url, content_type)
+    stem = PurePosixPath(urlsplit(url).path).stem or urlsplit(url).netloc
+    target = VENDOR_DIR / hashed_filename(stem, data, suffix)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    return public_path(target)
+
+
+def localize(sources: list, fixtures_dir: Path = None) -> tuple:
+    """Vendor the remote sources and return (manifest, failed URLs)."""
+    manifest = {}
+    failed = []
+    for url in sources:
+        if not is_remote(url):
+            continue
+        try:
+            manifest[url] = vendor_image(url, fixtures_dir)
+        except (OSError, ValueError) as error:
+            print(f"Could not vendor {url}: {error}", file=sys.stderr)
+            failed.append(url)
+    return manifest, failed
+
+
+def page_image_sources() -> list:
+    """Collect the original image URLs of the index page, undoing previous runs."""
+    from ..views.index import index
+
+    previous = {path: url for url, path in load_manifest(VENDOR_MANIFEST).items()}
+    sources = [previous.get(src, src) for src in collect_image_sources(index())]
+    # Responsive images render their generated variants, so take their originals.
+    extra = RESPONSIVE_SOURCES + REMOTE_ASSETS
+    return sources + [src for src in extra if src not in sources]
+
+
+def configure(parser):
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Read images from this directory (<host>/<path>) instead of the network.",
+    )
+
+
+def run(args) -> int:
+    manifest, failed = localize(page_image_sources(), args.fixtures)
+    write_manifest(VENDOR_MANIFEST, manifest)
+    print(f"Vendored {len(manifest)} files into {VENDOR_DIR}")
+    return 1 if failed else 0
@@ -0,0 +1,153 @@
+"""Compile the app, attribute the emitted page code to each section and enforce Brotli size budgets."""
+import gzip
+import sys
+from contextlib import contextmanager
+from unittest import mock
+
+import reflex as rx
+from reflex import constants
+
+from ..utils.assets import ASSETS_DIR
+from .common import ROOT_DIR, load_app_offline
+from .export import brotli_compress
+from .incremental import compile_section
+
+WEB_DIR = ROOT_DIR / constants.Dirs.WEB
+
+# Compiled page code, which the sections below are carved out of.
+PAGE_FILES = ("pages/index.js", "utils/stateful_components.js")
+
+
+# Compressed byte budgets; override with --budget name=bytes.
+BUDGETS = {
+    "page": 11_500,
+    "stylesheets": 1_000,
+    "navigation": 500,
+    "hero": 1_000,
+    "about": 2_000,
+    "projects": 6_000,
+    "blog": 1_000,
+    "contact": 1_500,
+}
+
+
+# Parts of the index page, by name, with the views.index function that builds each one.
+PAGE_PARTS = {
+    "navigation": "create_navigation_menu",
+    "hero": "create_hero_section",
+    "about": "about",
+    "projects": "projects",
+    "blog": "blog",
+    "contact": "contact",
+    "animations": "load_animations",
+}
+
+
+@contextmanager
+def without_part(name: str):
+    """Build the index page with one part replaced by an empty fragment."""
+    from ..views import index as views
+
+    target = PAGE_PARTS[name]
+    if target in views.SECTIONS:
+        patch = mock.patch.dict(views.SECTIONS[target], {"create": rx.fragment})
+    else:
+        patch = mock.patch.object(views, target, rx.fragment)
+    with patch:
+        yield
+
+
+def compile_index() -> bytes:
+    """Compile the index page component the way the app compiles its page module."""
+    from ..views.index import index
+
+    return compile_section(index).encode("utf-8")
+
+
+def compressed_size(data: bytes) -> int:
+    """Size after Brotli, or gzip when brotli is not installed."""
+    compressed = brotli_compress(data)
+    if compressed is None:
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    return len(compressed)
+
+
+def read_files(paths) -> bytes:
+    """Concatenate the files that exist among the given paths."""
+    return b"".join(path.read_bytes() for path in paths if path.exists())
+
+
+def measure() -> dict:
+    """Compile the app and return {name: (raw bytes, compressed bytes)} for sections and totals."""
+    app = load_app_offline()
+    app._compile(export=True)
+
+    # Each part is charged what the compiled page loses without it: its JSX, its hooks and
+    # memoized components, and the imports nothing else on the page needs.
+    full = compile_index()
+    full_compressed = compressed_size(full)
+    sizes = {}
+    for name in PAGE_PARTS:
+        with without_part(name):
+            reduced = compile_index()
+        sizes[name] = (len(full) - len(reduced), full_compressed - compressed_size(reduced))
+
+    page = read_files(WEB_DIR / path for path in PAGE_FILES)
+    attributed = sum(raw for raw, _ in sizes.values())
+    # The page wrapper, imports several parts share, and the app's own toaster and overlays.
+    sizes["shared"] = (len(page) - attributed, None)
+    sizes["page"] = (len(page), compressed_size(page))
+
+    # The app's own stylesheets, as shipped. styles/*.css in .web are only the Tailwind and
+    # @import sources Next.js compiles, so their bytes say nothing about what is served.
+    stylesheets = read_files(
+        ASSETS_DIR / path.lstrip("/") for path in app.stylesheets if path.startswith("/")
+    )
+    sizes["stylesheets"] = (len(stylesheets), compressed_size(stylesheets))
+    return sizes
+
+
+def report(sizes: dict, budgets: dict) -> list:
+    """Print the per-section table and return the names over budget."""
+    page_raw = sizes["page"][0]
+    over = []
+    print(f"{'part':<12} {'raw':>9} {'share':>7} {'brotli':>9} {'budget':>9}")
+    for name, (raw, compressed) in sizes.items():
+        share = f"{raw / page_raw:.1%}" if name != "stylesheets" else ""
+        brotli = f"{compressed:,}" if compressed is not None else ""
+        line = f"{name:<12} {raw:>9,} {share:>7} {brotli:>9}"
+        if name in budgets:
+            line += f" {budgets[name]:>9,}"
+            if compressed is not None and compressed > budgets[name]:
+                over.append(name)
+                line += "  OVER BUDGET"
+        print(line)
+    return over
+
+
+def parse_budget(value: str) -> tuple:
+    """Parse a NAME=BYTES command-line budget."""
+    name, _, size = value.partition("=")
+    if not size.isdigit():
+        raise ValueError(value)
+    return name, int(size)
+
+
+def configure(parser):
+    parser.add_argument(
+        "--budget",
+        type=parse_budget,
+        action="append",
+        default=[],
+        metavar="NAME=BYTES",
+        help="Override the compressed budget of a section, 'page' or 'stylesheets'.",
+    )
+
+
+def run(args) -> int:
+    budgets = {**BUDGETS, **dict(args.budget)}
+    over = report(measure(), budgets)
+    if over:
+        print(f"Over budget: {', '.join(over)}", file=sys.stderr)
+        return 1
+    return 0
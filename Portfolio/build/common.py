@@ -0,0 +1,52 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from reflex import constants
+
+from ..utils.assets import ASSETS_DIR, load_manifest
+
+# Repository root, where rxconfig.py lives.
+ROOT_DIR = ASSETS_DIR.parent
+
+
+def content_hash(data: bytes, length: int = 10) -> str:
+    """Return a short, stable hash of the given bytes."""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def hashed_filename(stem: str, data: bytes, suffix: str) -> str:
+    """Build a cache-busting file name such as `python-original.3f2a9c1b7e.svg`."""
+    stem = re.sub(r"[^A-Za-z0-9_-]+", "-", stem).strip("-") or "asset"
+    return f"{stem}.{content_hash(data)}{suffix}"
+
+
+def public_path(path: Path) -> str:
+    """Return the URL path under which Reflex serves a file from assets/."""
+    return "/" + path.relative_to(ASSETS_DIR).as_posix()
+
+
+def write_manifest(manifest_path: Path, manifest: dict):
+    """Write a manifest as sorted JSON and drop the cached copy."""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    load_manifest.cache_clear()
+
+
+def load_app_offline():
+    """Import Portfolio.app, ready to compile into .web without installing node packages."""
+    from reflex.utils import prerequisites
+
+    os.chdir(ROOT_DIR)
+    # Installing node packages is a one-off setup step, not part of a rebuild.
+    prerequisites.install_frontend_packages = lambda *args, **kwargs: None
+    if not (ROOT_DIR / constants.Dirs.WEB).exists():
+        prerequisites.initialize_web_directory()
+
+    from ..Portfolio import app
+
+    return app
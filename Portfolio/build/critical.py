@@ -0,0 +1,313 @@
+"""Inline the CSS that the prerendered markup needs and load the full stylesheets without blocking render."""
+import html
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+# Inlined CSS beyond this many bytes would push the hero past the first round trips;
+# such pages keep their blocking stylesheet and are reported instead.
+CRITICAL_BUDGET = 14 * 1024
+
+CRITICAL_MARKER = "data-critical"
+
+# At-rules whose blocks hold further rules; their contents are filtered rule by rule.
+GROUPING_AT_RULES = ("@media", "@supports", "@layer", "@container")
+
+# Elements that exist before any markup is rendered.
+ROOT_SELECTORS = {"html", "body", ":root"}
+
+COMMENT = re.compile(r"/\*.*?\*/", re.S)
+PSEUDO = re.compile(r"(?<!\\)::?[A-Za-z-]+(\((?:[^()]|\([^()]*\))*\))?")
+ATTRIBUTE = re.compile(r"\[\s*([A-Za-z_:][-A-Za-z0-9_:.]*)[^\]]*\]")
+CLASS_OR_ID = re.compile(r"([.#])((?:[-\w]|\\[0-9a-fA-F]{1,6} ?|\\.)+)")
+TAG = re.compile(r"^[A-Za-z][-A-Za-z0-9]*")
+COMBINATORS = re.compile(r"\s*[>+~]\s*|\s+")
+ESCAPE = re.compile(r"\\([0-9a-fA-F]{1,6}) ?|\\(.)")
+STYLESHEET_LINK = re.compile(r"<link\b[^>]*>", re.I)
+LINK_ATTRIBUTE = re.compile(r'([\w:-]+)(?:="([^"]*)")?')
+FONT_FAMILY = re.compile(r"font-family\s*:\s*([^;}]+)", re.I)
+FONT_URL = re.compile(r"url\(\s*['\"]?([^'\")]+\.woff2)['\"]?\s*\)", re.I)
+FONT_DISPLAY = re.compile(r"font-display\s*:\s*[\w-]+\s*;?", re.I)
+CUSTOM_PROPERTY = re.compile(r"(?<=[{;])\s*(--[\w-]+)\s*:[^;{}]*;?")
+VAR_REFERENCE = re.compile(r"var\(\s*(--[\w-]+)")
+EMPTY_RULE = re.compile(r"[^{};]+\{\s*\}")
+
+
+class Markup(HTMLParser):
+    """Collect what selectors can match in a page: tags, ids, classes and attribute names."""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = set()
+        self.ids = set()
+        self.classes = set()
+        self.attributes = set()
+        self.inline_css = []
+        self.in_style = False
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        for name, value in attrs:
+            self.attributes.add(name)
+            if name == "id" and value:
+                self.ids.add(value)
+            elif name == "class" and value:
+                self.classes.update(value.split())
+            elif name == "style" and value:
+                self.inline_css.append(value)
+        self.in_style = tag == "style"
+
+    def handle_endtag(self, tag):
+        self.in_style = False
+
+    def handle_data(self, data):
+        if self.in_style:
+            self.inline_css.append(data)
+
+
+def unescape(identifier: str) -> str:
+    """Decode CSS escapes such as `md\\:flex` or `\\31 0`."""
+    return ESCAPE.sub(
+        lambda match: chr(int(match.group(1), 16)) if match.group(1) else match.group(2),
+        identifier,
+    )
+
+
+def split_top_level(text: str, separator: str = ",") -> list:
+    """Split on a separator outside parentheses and brackets."""
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def compound_may_match(compound: str, markup: Markup) -> bool:
+    """Check the parts of one compound selector that the markup can rule out."""
+    for name in ATTRIBUTE.findall(compound):
+        if name not in markup.attributes:
+            return False
+    compound = ATTRIBUTE.sub("", compound)
+    for kind, name in CLASS_OR_ID.findall(compound):
+        names = markup.classes if kind == "." else markup.ids
+        if unescape(name) not in names:
+            return False
+    tag = TAG.match(compound)
+    return not tag or tag.group(0).lower() in markup.tags | ROOT_SELECTORS
+
+
+def selector_may_match(selector: str, markup: Markup) -> bool:
+    """Over-approximate whether a selector matches: pseudo-classes, states and
+    combinators are ignored, so rules for hover or focus states are kept too."""
+    selector = selector.strip()
+    if selector in ROOT_SELECTORS:
+        return True
+    return all(
+        compound_may_match(compound, markup)
+        for compound in COMBINATORS.split(PSEUDO.sub("", selector))
+        if compound
+    )
+
+
+def block_end(css: str, start: int) -> int:
+    """Return the index just past the block opened at css[start] == "{"."""
+    depth, index, quote = 0, start, None
+    while index < len(css):
+        char = css[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return len(css)
+
+
+def parse_blocks(css: str):
+    """Yield (prelude, body) for each top-level rule; body is None for statements like @import."""
+    index = 0
+    while index < len(css):
+        brace = css.find("{", index)
+        semicolon = css.find(";", index)
+        if brace == -1 and semicolon == -1:
+            return
+        if semicolon != -1 and (brace == -1 or semicolon < brace) and css[index:semicolon].strip().startswith("@"):
+            yield css[index:semicolon].strip(), None
+            index = semicolon + 1
+            continue
+        end = block_end(css, brace)
+        yield css[index:brace].strip(), css[brace + 1:end - 1]
+        index = end
+
+
+def filter_rules(css: str, markup: Markup) -> list:
+    """Keep the rules and grouped rules that may apply to the markup; other at-rules are returned
+    as (prelude, body) for the caller to decide on. @import statements stay in the deferred
+    stylesheet: inlined, they would block rendering on another request."""
+    kept, at_rules = [], []
+    for prelude, body in parse_blocks(css):
+        if body is None:
+            if prelude.startswith("@layer"):
+                kept.append(prelude + ";")
+        elif prelude.startswith(GROUPING_AT_RULES):
+            inner, nested = filter_rules(body, markup)
+            at_rules.extend(nested)
+            if inner:
+                kept.append(f"{prelude}{{{''.join(inner)}}}")
+        elif prelude.startswith("@"):
+            at_rules.append((prelude, body))
+        elif any(selector_may_match(selector, markup) for selector in split_top_level(prelude)):
+            kept.append(f"{prelude}{{{body.strip()}}}")
+    return kept, at_rules
+
+
+def font_families(css: str) -> set:
+    """Return the lower-cased font family names used by font-family declarations."""
+    families = set()
+    for value in FONT_FAMILY.findall(css):
+        families.update(name.strip(" '\"").lower() for name in value.split(","))
+    return families
+
+
+def swap_font_display(body: str) -> str:
+    """Make a @font-face show fallback text immediately and swap the webfont in when it arrives."""
+    return FONT_DISPLAY.sub("", body).strip().rstrip(";") + ";font-display:swap"
+
+
+def used_custom_properties(css: str) -> set:
+    """Return the custom properties that var() reaches from ordinary declarations, following
+    custom properties defined in terms of others."""
+    definitions, used = {}, set()
+    for declaration in re.split(r"[{};]", css):
+        name, colon, value = declaration.partition(":")
+        name = name.strip()
+        if colon and name.startswith("--"):
+            definitions.setdefault(name, set()).update(VAR_REFERENCE.findall(value))
+        else:
+            used.update(VAR_REFERENCE.findall(declaration))
+    pending = list(used)
+    while pending:
+        for reference in definitions.get(pending.pop(), ()):
+            if reference not in used:
+                used.add(reference)
+                pending.append(reference)
+    return used
+
+
+def prune_custom_properties(css: str, used: set) -> str:
+    """Drop custom property declarations outside `used`, then the rules left empty. Theme
+    blocks such as Radix's `:root, .light` define hundreds of tokens the first paint never reads."""
+    css = CUSTOM_PROPERTY.sub(lambda match: match.group(0) if match.group(1) in used else "", css)
+    while True:
+        pruned = EMPTY_RULE.sub("", css)
+        if pruned == css:
+            return css
+        css = pruned
+
+
+def critical_css(stylesheets: list, markup: Markup) -> tuple:
+    """Extract the critical CSS of a page from (href, css) pairs; return it with the webfont
+    URLs worth preloading, resolved against the stylesheet that declares them."""
+    rules, at_rules = [], []
+    for href, css in stylesheets:
+        kept, nested = filter_rules(COMMENT.sub("", css), markup)
+        rules.extend(kept)
+        at_rules.extend((href, prelude, body) for prelude, body in nested)
+    used_css = "".join(rules) + "".join(markup.inline_css)
+    families = font_families(used_css)
+    fonts, preloads = [], []
+    for href, prelude, body in at_rules:
+        name = prelude.split(None, 1)[-1] if " " in prelude else ""
+        if prelude.startswith("@font-face"):
+            if font_families(body) & families:
+                fonts.append(f"@font-face{{{swap_font_display(body)}}}")
+                preloads.extend(urljoin(href, url) for url in FONT_URL.findall(body)[:1])
+        elif prelude.startswith(("@keyframes", "@-webkit-keyframes")) and name in used_css:
+            fonts.append(f"{prelude}{{{body.strip()}}}")
+    # @layer statements must precede every other rule.
+    statements = [rule for rule in rules if rule.endswith(";")]
+    blocks = "".join(fonts) + "".join(rule for rule in rules if not rule.endswith(";"))
+    used = used_custom_properties(blocks + "".join(markup.inline_css))
+    return "".join(statements) + prune_custom_properties(blocks, used), list(dict.fromkeys(preloads))
+
+
+def link_attributes(tag: str) -> dict:
+    """Parse the attributes of a <link> tag as written by Next.js."""
+    return {
+        name.lower(): html.unescape(value or "")
+        for name, value in LINK_ATTRIBUTE.findall(tag[len("<link"):].rstrip("/>"))
+    }
+
+
+def local_stylesheet(static_dir: Path, href: str):
+    """Return the exported file behind a same-origin stylesheet href, or None."""
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc or not parts.path.endswith(".css"):
+        return None
+    path = static_dir / parts.path.lstrip("/")
+    return path if path.is_file() else None
+
+
+def deferred_link(tag: str, href: str) -> str:
+    """Turn a blocking stylesheet link into a preload that applies itself once loaded."""
+    deferred = re.sub(r'\brel="stylesheet"', 'rel="preload" as="style"', tag, flags=re.I)
+    deferred = deferred.replace("<link", "<link onload=\"this.onload=null;this.rel='stylesheet'\"", 1)
+    return f'{deferred}<noscript><link rel="stylesheet" href="{html.escape(href)}"/></noscript>'
+
+
+def inline_critical_css(page: Path, static_dir: Path, budget: int = CRITICAL_BUDGET) -> tuple:
+    """Rewrite one exported page; return (critical bytes, status) where status is
+    "inlined", "skipped" (already processed or no local stylesheets) or "over budget"."""
+    source = page.read_text(encoding="utf-8")
+    if CRITICAL_MARKER in source:
+        return 0, "skipped"
+    page_url = "/" + page.relative_to(static_dir).as_posix()
+    links, preloaded = [], set()
+    for match in STYLESHEET_LINK.finditer(source):
+        attributes = link_attributes(match.group(0))
+        rel = attributes.get("rel", "").lower()
+        if rel == "preload" and attributes.get("as", "").lower() == "font":
+            # Faces the app already preloads (styles.PRELOADED_FONTS) are not hinted twice.
+            preloaded.add(urljoin(page_url, attributes.get("href", "")))
+        if rel != "stylesheet":
+            continue
+        path = local_stylesheet(static_dir, attributes.get("href", ""))
+        if path is not None:
+            links.append((match, urljoin(page_url, attributes["href"]), path))
+    if not links:
+        return 0, "skipped"
+
+    markup = Markup()
+    markup.feed(source)
+    css, preloads = critical_css(
+        [(href, path.read_text(encoding="utf-8")) for _, href, path in links], markup
+    )
+    size = len(css.encode("utf-8"))
+    if size > budget:
+        return size, "over budget"
+
+    head = "".join(
+        f'<link rel="preload" href="{html.escape(url)}" as="font" type="font/woff2" crossorigin=""/>'
+        for url in preloads if url not in preloaded
+    ) + f"<style {CRITICAL_MARKER}>{css}</style>"
+    # Rewrite from the end so earlier match offsets stay valid.
+    for match, href, _ in reversed(links):
+        source = source[:match.start()] + deferred_link(match.group(0), href) + source[match.end():]
+    first = links[0][0].start()
+    page.write_text(source[:first] + head + source[first:], encoding="utf-8")
+    return size, "inlined"
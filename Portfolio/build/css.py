@@ -0,0 +1,80 @@
+"""Compile the static classes of utils/styles.py into a plain stylesheet."""
+import sys
+
+from reflex.style import format_style_key
+from reflex.utils.format import to_kebab_case, to_snake_case
+
+from ..utils.assets import ASSETS_DIR
+from ..utils.styles import STATIC_CLASSES, STATIC_STYLESHEET
+from .common import public_path
+
+STYLESHEET_PATH = ASSETS_DIR / STATIC_STYLESHEET.lstrip("/")
+
+
+def css_names(key: str) -> list:
+    """Expand a Reflex style key (including shorthands like padding_x) into CSS properties."""
+    return [
+        name if name.startswith("--") else to_kebab_case(to_snake_case(name))
+        for name in format_style_key(key)
+    ]
+
+
+def nested_selector(selector: str, key: str) -> str:
+    """Resolve a pseudo selector key (_hover, :hover or &:hover) against its parent."""
+    if key.startswith("_"):
+        return f"{selector}:{key[1:].replace('_', '-')}"
+    if key.startswith("&"):
+        return selector + key[1:]
+    return selector + key
+
+
+def compile_rules(selector: str, style: dict) -> list:
+    """Compile one style dict into CSS rules, nested selectors last."""
+    declarations = []
+    nested = []
+    for key, value in style.items():
+        if isinstance(value, dict):
+            nested.extend(compile_rules(nested_selector(selector, key), value))
+            continue
+        for name in css_names(key):
+            declarations.append(f"  {name}: {value};")
+    rules = [f"{selector} {{\n" + "\n".join(declarations) + "\n}"] if declarations else []
+    return rules + nested
+
+
+def compile_stylesheet() -> str:
+    """Compile STATIC_CLASSES into one stylesheet."""
+    rules = []
+    for class_name, style in STATIC_CLASSES.items():
+        rules.extend(compile_rules(f".{class_name}", style))
+    return "/* Generated by Portfolio/build/css.py; edit utils/styles.py instead. */\n" + (
+        "\n\n".join(rules) + "\n"
+    )
+
+
+def write_stylesheet() -> str:
+    """Write the static stylesheet if it changed and return its public path."""
+    css = compile_stylesheet()
+    if not STYLESHEET_PATH.exists() or STYLESHEET_PATH.read_text(encoding="utf-8") != css:
+        STYLESHEET_PATH.parent.mkdir(parents=True, exist_ok=True)
+        STYLESHEET_PATH.write_text(css, encoding="utf-8")
+    return public_path(STYLESHEET_PATH)
+
+
+def configure(parser):
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the committed stylesheet is out of date instead of writing it.",
+    )
+
+
+def run(args) -> int:
+    if args.check:
+        if STYLESHEET_PATH.exists() and STYLESHEET_PATH.read_text(encoding="utf-8") == compile_stylesheet():
+            return 0
+        print(f"{public_path(STYLESHEET_PATH)} is out of date; run python -m Portfolio.build css",
+              file=sys.stderr)
+        return 1
+    print(f"Wrote {write_stylesheet()}")
+    return 0
@@ -0,0 +1,36 @@
+"""Split the project detail panes out of the page into per-project JSON chunks fetched on demand."""
+from ..data.catalog import details_digest, details_payload, load_projects
+from ..utils.assets import PROJECT_DETAILS_DIR, PROJECT_DETAILS_MANIFEST
+from .common import hashed_filename, public_path, write_manifest
+
+
+def write_details_chunks(projects) -> dict:
+    """Write each project's details as a content-hashed JSON file; return {project id: {src, sha256}}."""
+    manifest = {}
+    for project in projects:
+        data = details_payload(project["details"])
+        target = PROJECT_DETAILS_DIR / hashed_filename(project["id"], data, ".json")
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        # The digest lets components spot a chunk older than the catalog and inline the details.
+        manifest[project["id"]] = {"src": public_path(target), "sha256": details_digest(project["details"])}
+
+    published = {chunk["src"] for chunk in manifest.values()}
+    for stale in PROJECT_DETAILS_DIR.glob("*.json"):
+        if stale != PROJECT_DETAILS_MANIFEST and public_path(stale) not in published:
+            stale.unlink()
+    return manifest
+
+
+def configure(parser):
+    pass
+
+
+def run(args) -> int:
+    manifest = write_details_chunks(load_projects())
+    write_manifest(PROJECT_DETAILS_MANIFEST, manifest)
+    size = sum((PROJECT_DETAILS_DIR / chunk["src"].rpartition("/")[2]).stat().st_size
+               for chunk in manifest.values())
+    print(f"Wrote {len(manifest)} project detail chunks ({size} bytes) into {PROJECT_DETAILS_DIR}")
+    return 0
@@ -0,0 +1,147 @@
+"""Export the static site with inlined critical CSS, precompressed .br/.gz siblings and a cache manifest."""
+import gzip
+import json
+import mimetypes
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from reflex import constants
+
+from ..utils.lazy import PRERENDER_ENV
+from .common import ROOT_DIR
+from .critical import CRITICAL_BUDGET, inline_critical_css
+
+# Where `reflex export --frontend-only` leaves the static site.
+STATIC_DIR = ROOT_DIR / constants.Dirs.WEB / constants.Dirs.STATIC
+
+MANIFEST_NAME = "cache-manifest.json"
+
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".svg", ".json", ".txt", ".xml", ".map"}
+
+# Files below this size gain nothing from compression.
+MIN_COMPRESS_SIZE = 256
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+SHORT_TTL = "public, max-age=300, must-revalidate"
+DEFAULT_TTL = "public, max-age=3600"
+
+# Next.js chunks live under _next/static; our own stages add a 10+ hex digit hash.
+HASHED_PATH = re.compile(r"(^_next/static/)|([.-][0-9a-f]{10,}\.[A-Za-z0-9]+$)")
+
+
+def run_reflex_export(prerender: bool = False):
+    """Build the frontend with Reflex into STATIC_DIR."""
+    env = dict(os.environ)
+    if prerender:
+        env[PRERENDER_ENV] = "1"
+    subprocess.run(
+        [sys.executable, "-m", "reflex", "export", "--frontend-only", "--no-zip"],
+        cwd=ROOT_DIR,
+        env=env,
+        check=True,
+    )
+
+
+def cache_control(relative_path: str) -> str:
+    """Pick the Cache-Control policy for a file in the static output."""
+    if relative_path.endswith(".html"):
+        return SHORT_TTL
+    if HASHED_PATH.search(relative_path):
+        return IMMUTABLE
+    return DEFAULT_TTL
+
+
+def brotli_compress(data: bytes):
+    """Compress with Brotli at maximum quality, or return None if brotli is missing."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+def precompress(path: Path) -> list:
+    """Write .br and .gz siblings for a file and return the encodings kept."""
+    data = path.read_bytes()
+    if path.suffix not in COMPRESSIBLE_SUFFIXES or len(data) < MIN_COMPRESS_SIZE:
+        return []
+
+    encodings = []
+    candidates = (
+        ("br", ".br", brotli_compress(data)),
+        # mtime=0 keeps the output byte-identical across builds.
+        ("gzip", ".gz", gzip.compress(data, compresslevel=9, mtime=0)),
+    )
+    for encoding, suffix, compressed in candidates:
+        sibling = path.with_name(path.name + suffix)
+        if compressed is None or len(compressed) >= len(data):
+            sibling.unlink(missing_ok=True)
+            continue
+        sibling.write_bytes(compressed)
+        encodings.append(encoding)
+    return encodings
+
+
+def inline_critical(static_dir: Path, budget: int) -> int:
+    """Inline each page's critical CSS and return the number of pages over budget."""
+    over_budget = 0
+    for page in sorted(static_dir.rglob("*.html")):
+        size, status = inline_critical_css(page, static_dir, budget)
+        if status == "skipped":
+            continue
+        print(f"{page.relative_to(static_dir)}: {size} bytes of critical CSS ({status})")
+        over_budget += status == "over budget"
+    return over_budget
+
+
+def build_manifest(static_dir: Path) -> dict:
+    """Precompress every file in the export and describe how to serve it."""
+    files = {}
+    for path in sorted(static_dir.rglob("*")):
+        if not path.is_file() or path.suffix in (".br", ".gz") or path.name == MANIFEST_NAME:
+            continue
+        relative_path = path.relative_to(static_dir).as_posix()
+        files["/" + relative_path] = {
+            "cache_control": cache_control(relative_path),
+            "content_type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "encodings": precompress(path),
+            "size": path.stat().st_size,
+        }
+    return files
+
+
+def configure(parser):
+    parser.add_argument(
+        "--skip-build",
+        action="store_true",
+        help="Post-process the existing export instead of running `reflex export`.",
+    )
+    parser.add_argument("--static-dir", type=Path, default=STATIC_DIR)
+    parser.add_argument(
+        "--prerender",
+        action="store_true",
+        help="Render every section into the static HTML instead of only the hero.",
+    )
+    parser.add_argument(
+        "--no-critical",
+        action="store_true",
+        help="Keep the render-blocking stylesheet links instead of inlining critical CSS.",
+    )
+    parser.add_argument("--critical-budget", type=int, default=CRITICAL_BUDGET,
+                        help="Pages needing more critical CSS than this keep blocking stylesheets.")
+
+
+def run(args) -> int:
+    if not args.skip_build:
+        run_reflex_export(args.prerender)
+    over_budget = 0 if args.no_critical else inline_critical(args.static_dir, args.critical_budget)
+    files = build_manifest(args.static_dir)
+    (args.static_dir / MANIFEST_NAME).write_text(
+        json.dumps({"files": files}, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    compressed = sum(1 for entry in files.values() if entry["encodings"])
+    print(f"Precompressed {compressed} of {len(files)} files in {args.static_dir}")
+    return 1 if over_budget else 0
@@ -0,0 +1,225 @@
+"""Self-host the Font families as WOFF2 subsets of the characters the site renders, with @font-face rules."""
+import ast
+import io
+import json
+import re
+import sys
+from pathlib import Path
+from urllib.parse import quote, urljoin
+
+from ..data.catalog import CATALOG_PATH, GITHUB_METADATA_PATH
+from ..data.posts import POSTS_PATH
+from ..utils.assets import ASSETS_DIR, FONTS_DIR, FONTS_MANIFEST
+from ..utils.styles import FONT_WEIGHTS, Font, font_family
+from .assets import fetch
+from .common import ROOT_DIR, hashed_filename, public_path, write_manifest
+
+GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2"
+
+# Google Fonts only serves WOFF2 to browsers it recognises.
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+)
+
+FONTS_STYLESHEET = ASSETS_DIR / "css" / "fonts.css"
+
+# Sources whose string literals are rendered as page text.
+TEXT_SOURCES = ("components", "views")
+CONTENT_FILES = (CATALOG_PATH, GITHUB_METADATA_PATH, POSTS_PATH)
+
+# Always kept, so digits and punctuation formatted at runtime still have glyphs.
+BASE_CHARACTERS = {chr(code) for code in range(0x20, 0x7F)}
+
+FONT_FACE = re.compile(r"@font-face\s*{([^}]*)}")
+DESCRIPTOR = re.compile(r"([\w-]+)\s*:\s*([^;]+)")
+SOURCE_URL = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+
+
+def stylesheet_url(weights: dict) -> str:
+    """Build the Google Fonts CSS URL for {family: weights}."""
+    query = "&".join(
+        f"family={quote(family)}:wght@{';'.join(str(weight) for weight in sorted(family_weights))}"
+        for family, family_weights in weights.items()
+    )
+    return f"{GOOGLE_FONTS_CSS}?{query}&display=swap"
+
+
+def parse_unicode_range(value: str) -> list:
+    """Parse "U+0000-00FF, U+0131" into inclusive (start, end) code point pairs."""
+    ranges = []
+    for part in value.split(","):
+        part = part.strip().upper().removeprefix("U+")
+        if not part:
+            continue
+        if "?" in part:
+            start, end = part.replace("?", "0"), part.replace("?", "F")
+        else:
+            start, _, end = part.partition("-")
+        ranges.append((int(start, 16), int(end or start, 16)))
+    return ranges or [(0, 0x10FFFF)]
+
+
+def format_unicode_range(codepoints) -> str:
+    """Describe a set of code points as a compact unicode-range value."""
+    parts = []
+    for code in sorted(codepoints):
+        if parts and parts[-1][1] == code - 1:
+            parts[-1][1] = code
+        else:
+            parts.append([code, code])
+    return ", ".join(
+        f"U+{start:X}" if start == end else f"U+{start:X}-{end:X}" for start, end in parts
+    )
+
+
+def parse_font_faces(css: str, base_url: str) -> list:
+    """Read the normal-style faces of a Google Fonts stylesheet."""
+    faces = []
+    for body in FONT_FACE.findall(css):
+        descriptors = {name.lower(): value.strip() for name, value in DESCRIPTOR.findall(body)}
+        source = SOURCE_URL.search(descriptors.get("src", ""))
+        if source is None or descriptors.get("font-style", "normal") != "normal":
+            continue
+        faces.append({
+            "family": descriptors["font-family"].strip("'\""),
+            "weight": int(descriptors.get("font-weight", "400")),
+            "url": urljoin(base_url, source.group(1)),
+            "ranges": parse_unicode_range(descriptors.get("unicode-range", "")),
+        })
+    return faces
+
+
+def json_strings(value):
+    """Yield every string inside decoded JSON."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from json_strings(item)
+
+
+def site_characters() -> set:
+    """Collect the characters the page can render: component text and catalog/blog content."""
+    characters = set(BASE_CHARACTERS)
+    for directory in TEXT_SOURCES:
+        for path in (ROOT_DIR / "Portfolio" / directory).rglob("*.py"):
+            for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+                if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    characters.update(node.value)
+    for path in CONTENT_FILES:
+        if path.exists():
+            for text in json_strings(json.loads(path.read_text(encoding="utf-8"))):
+                characters.update(text)
+    return {character for character in characters if character.isprintable()}
+
+
+def subset_woff2(data: bytes, codepoints, weight: int) -> bytes:
+    """Subset a font to the given code points and encode it as WOFF2."""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    font = TTFont(io.BytesIO(data))
+    if "fvar" in font:
+        # Google serves one variable font for every weight; pin the weight this face declares.
+        font = instancer.instantiateVariableFont(font, {"wght": weight})
+    options = subset.Options()
+    options.flavor = "woff2"
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    output = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(output)
+    return output.getvalue()
+
+
+def font_face_rule(face: dict) -> str:
+    """Render the @font-face rule of one self-hosted face."""
+    return (
+        "@font-face {\n"
+        f"  font-family: '{face['family']}';\n"
+        "  font-style: normal;\n"
+        f"  font-weight: {face['weight']};\n"
+        "  font-display: swap;\n"
+        f"  src: url({face['src']}) format('woff2');\n"
+        f"  unicode-range: {face['unicode_range']};\n"
+        "}"
+    )
+
+
+def configure(parser):
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Read the Google Fonts CSS and font files from this directory (<host>/<path>).",
+    )
+
+
+def run(args) -> int:
+    weights = {font_family(font): FONT_WEIGHTS[font] for font in Font}
+    url = stylesheet_url(weights)
+    try:
+        css, _ = fetch(url, args.fixtures, BROWSER_USER_AGENT)
+    except OSError as error:
+        print(f"Could not fetch {url}: {error}", file=sys.stderr)
+        return 1
+
+    characters = {ord(character) for character in site_characters()}
+    faces = []
+    failed = []
+    downloads = {}
+    for face in parse_font_faces(css.decode("utf-8"), url):
+        if face["weight"] not in weights.get(face["family"], ()):
+            continue
+        codepoints = {
+            code for code in characters
+            if any(start <= code <= end for start, end in face["ranges"])
+        }
+        # Skip script subsets (Cyrillic, Greek, ...) the site never renders.
+        if not codepoints:
+            continue
+        try:
+            if face["url"] not in downloads:
+                downloads[face["url"]] = fetch(face["url"], args.fixtures)[0]
+            data = subset_woff2(downloads[face["url"]], codepoints, face["weight"])
+        except (OSError, ValueError) as error:
+            print(f"Could not subset {face['url']}: {error}", file=sys.stderr)
+            failed.append(face["url"])
+            continue
+        stem = f"{face['family']}-{face['weight']}"
+        target = FONTS_DIR / hashed_filename(stem, data, ".woff2")
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        faces.append({
+            "family": face["family"],
+            "weight": face["weight"],
+            "src": public_path(target),
+            "unicode_range": format_unicode_range(codepoints),
+            "characters": len(codepoints),
+        })
+    if failed:
+        # Keep the previous faces rather than shipping a stylesheet with missing weights.
+        return 1
+
+    # Widest subset first: styles.font_preloads() preloads the first face of each weight.
+    faces.sort(key=lambda face: (face["family"], face["weight"], -face["characters"]))
+    kept = {face["src"] for face in faces}
+    for stale in FONTS_DIR.glob("*.woff2"):
+        if public_path(stale) not in kept:
+            stale.unlink()
+    FONTS_STYLESHEET.parent.mkdir(parents=True, exist_ok=True)
+    FONTS_STYLESHEET.write_text(
+        "/* Generated by Portfolio/build/fonts.py from styles.Font. */\n"
+        + "\n\n".join(font_face_rule(face) for face in faces) + "\n",
+        encoding="utf-8",
+    )
+    write_manifest(FONTS_MANIFEST, {"stylesheet": public_path(FONTS_STYLESHEET), "faces": faces})
+    size = sum((ASSETS_DIR / face["src"].lstrip("/")).stat().st_size for face in faces)
+    print(f"Wrote {len(faces)} font faces ({size} bytes of WOFF2) for {', '.join(weights)}")
+    return 0
@@ -0,0 +1,150 @@
+"""Bake stars, last-commit date and language mix of the catalog's GitHub repos into the project data."""
+import json
+import os
+import re
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from ..data.catalog import GITHUB_METADATA_PATH, read_catalog
+from ..utils.assets import load_manifest
+from .assets import REQUEST_TIMEOUT, USER_AGENT, fixture_path
+from .common import ROOT_DIR, write_manifest
+
+API_URL = "https://api.github.com"
+
+# Raw API responses with their ETag, kept between builds.
+CACHE_DIR = ROOT_DIR / ".cache" / "github"
+
+# Cached responses younger than this are used without asking GitHub at all;
+# older ones are revalidated with If-None-Match, which is free when unchanged.
+CACHE_TTL = 6 * 60 * 60
+
+# Languages listed in a card's language mix.
+TOP_LANGUAGES = 3
+
+
+def repository(href: str):
+    """Return "owner/name" for a github.com repository URL, or None."""
+    parts = urlsplit(href)
+    path = parts.path.strip("/").split("/")
+    if parts.netloc not in ("github.com", "www.github.com") or len(path) < 2:
+        return None
+    return f"{path[0]}/{path[1].removesuffix('.git')}"
+
+
+def cache_path(url: str) -> Path:
+    """Map an API URL to its cache file."""
+    parts = urlsplit(url)
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{parts.netloc}{parts.path}?{parts.query}".strip("/?"))
+    return CACHE_DIR / f"{name}.json"
+
+
+class GitHubClient:
+    """GitHub REST client backed by the on-disk TTL cache, or by recorded fixtures."""
+
+    def __init__(self, api_url=API_URL, fixtures_dir=None, ttl=CACHE_TTL, token=None):
+        self.api_url = api_url.rstrip("/")
+        self.fixtures_dir = fixtures_dir
+        self.ttl = ttl
+        self.token = token
+
+    def get(self, path: str):
+        """GET an API path and return the decoded JSON body."""
+        url = self.api_url + path
+        if self.fixtures_dir is not None:
+            # <fixtures>/api.github.com/repos/<owner>/<name>/languages.json, query ignored.
+            fixture = Path(f"{fixture_path(self.fixtures_dir, url)}.json")
+            return json.loads(fixture.read_text(encoding="utf-8"))
+
+        cache_file = cache_path(url)
+        cached = None
+        if cache_file.exists():
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if time.time() - cached["fetched_at"] < self.ttl:
+                return cached["body"]
+
+        headers = {"User-Agent": USER_AGENT, "Accept": "application/vnd.github+json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        try:
+            request = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                body = json.loads(response.read())
+                etag = response.headers.get("ETag")
+        except urllib.error.HTTPError as error:
+            if error.code != 304 or cached is None:
+                raise
+            body, etag = cached["body"], cached["etag"]
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"etag": etag, "fetched_at": time.time(), "body": body}),
+            encoding="utf-8",
+        )
+        return body
+
+
+def language_mix(languages: dict) -> str:
+    """Summarize GitHub's bytes-per-language as "Python 72%, Jupyter Notebook 28%"."""
+    total = sum(languages.values())
+    if not total:
+        return ""
+    ranked = sorted(languages.items(), key=lambda item: item[1], reverse=True)
+    return ", ".join(
+        f"{name} {round(100 * size / total)}%" for name, size in ranked[:TOP_LANGUAGES]
+    )
+
+
+def repository_metadata(client: GitHubClient, repo: str) -> dict:
+    """Collect the card metadata of one repository."""
+    info = client.get(f"/repos/{repo}")
+    commits = client.get(f"/repos/{repo}/commits?per_page=1")
+    last_commit = commits[0]["commit"]["committer"]["date"] if commits else info["pushed_at"]
+    return {
+        "stars": info["stargazers_count"],
+        "last_commit": last_commit[:10],
+        "language_mix": language_mix(client.get(f"/repos/{repo}/languages")),
+    }
+
+
+def configure(parser):
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Replay API responses from this directory (<host>/<path>.json) instead of the network.",
+    )
+    parser.add_argument(
+        "--api-url",
+        default=API_URL,
+        help="GitHub API base URL, e.g. a local mock server.",
+    )
+    parser.add_argument("--ttl", type=int, default=CACHE_TTL,
+                        help="Seconds before a cached response is revalidated.")
+
+
+def run(args) -> int:
+    client = GitHubClient(args.api_url, args.fixtures, args.ttl, os.environ.get("GITHUB_TOKEN"))
+    previous = load_manifest(GITHUB_METADATA_PATH)
+    metadata = {}
+    failed = []
+    for project in read_catalog():
+        repo = repository(project["href"])
+        if repo is None:
+            continue
+        try:
+            metadata[project["href"]] = repository_metadata(client, repo)
+        except (OSError, ValueError, KeyError, IndexError) as error:
+            print(f"Could not fetch {repo}: {error}", file=sys.stderr)
+            failed.append(repo)
+            # Stale numbers are better than a card losing its metadata.
+            if project["href"] in previous:
+                metadata[project["href"]] = previous[project["href"]]
+    write_manifest(GITHUB_METADATA_PATH, metadata)
+    print(f"Wrote metadata for {len(metadata)} repositories to {GITHUB_METADATA_PATH.name}")
+    return 1 if failed else 0
@@ -0,0 +1,124 @@
+"""Generate resized AVIF/WebP/JPEG variants and srcset data for responsive images."""
+import io
+import sys
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlsplit
+
+from ..utils.assets import (
+    ASSETS_DIR,
+    IMAGES_DIR,
+    IMAGES_MANIFEST,
+    RESPONSIVE_SOURCES,
+    asset_src,
+    load_manifest,
+)
+from .common import hashed_filename, public_path, write_manifest
+
+# Widths generated for every image, capped at the source width.
+WIDTHS = (160, 320, 640, 960, 1280)
+
+# Encoder settings per output format, best compression first.
+FORMATS = {
+    "image/avif": ("AVIF", ".avif", {"quality": 50}),
+    "image/webp": ("WEBP", ".webp", {"quality": 75, "method": 6}),
+    "image/jpeg": ("JPEG", ".jpg", {"quality": 80, "optimize": True, "progressive": True}),
+    "image/png": ("PNG", ".png", {"optimize": True}),
+}
+
+
+def source_path(src: str) -> Path:
+    """Resolve an image src to a file under assets/, following the vendor manifest."""
+    local = asset_src(src)
+    if urlsplit(local).scheme:
+        raise FileNotFoundError(
+            f"{src} is remote; run `python -m Portfolio.build assets` first")
+    return ASSETS_DIR / local.lstrip("/")
+
+
+def target_widths(source_width: int) -> list:
+    """Return the variant widths for an image, never upscaling."""
+    widths = [width for width in WIDTHS if width < source_width]
+    return widths + [min(source_width, WIDTHS[-1])]
+
+
+def output_formats(image) -> list:
+    """Pick the formats to encode: modern ones plus a JPEG, or PNG for transparent images."""
+    from PIL import features
+
+    fallback = "image/png" if image.has_transparency_data else "image/jpeg"
+    modern = [
+        mime for mime, name in (("image/avif", "avif"), ("image/webp", "webp"))
+        if features.check(name)
+    ]
+    return modern + [fallback]
+
+
+def encode(image, mime: str) -> bytes:
+    """Encode a Pillow image in the given format."""
+    pil_format, _, options = FORMATS[mime]
+    if pil_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def build_variants(src: str) -> dict:
+    """Write every width/format variant of one image and return its manifest entry."""
+    from PIL import Image, ImageOps
+
+    path = source_path(src)
+    with Image.open(path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    stem = PurePosixPath(urlsplit(src).path).stem or path.stem
+    sources = {}
+    fallback = None
+    for mime in output_formats(image):
+        candidates = []
+        for width in target_widths(image.width):
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            data = encode(resized, mime)
+            target = IMAGES_DIR / hashed_filename(f"{stem}-{width}", data, FORMATS[mime][1])
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+            candidates.append(f"{public_path(target)} {width}w")
+            fallback = public_path(target)
+        sources[mime] = ", ".join(candidates)
+
+    return {
+        "width": image.width,
+        "height": image.height,
+        "sources": sources,
+        "fallback": fallback,
+    }
+
+
+def configure(parser):
+    pass
+
+
+def run(args) -> int:
+    from ..views.index import index
+
+    index()
+    previous = load_manifest(IMAGES_MANIFEST)
+    manifest = {}
+    failed = []
+    for src in RESPONSIVE_SOURCES:
+        try:
+            manifest[src] = build_variants(src)
+        except (OSError, ValueError) as error:
+            print(f"Could not generate variants of {src}: {error}", file=sys.stderr)
+            failed.append(src)
+            # Keep the variants of the last successful run rather than dropping the image.
+            if src in previous:
+                manifest[src] = previous[src]
+    write_manifest(IMAGES_MANIFEST, manifest)
+    print(f"Generated variants for {len(RESPONSIVE_SOURCES) - len(failed)} images into {IMAGES_DIR}")
+    return 1 if failed else 0
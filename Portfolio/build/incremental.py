@@ -0,0 +1,230 @@
+"""Compile page sections into their own JS modules, rebuilding only those whose sources or content changed.
+
+With PORTFOLIO_INCREMENTAL=1 the index page imports each section from
+.web/utils/sections/<id>.js instead of building it inline. A section module
+starts with a fingerprint of every Portfolio module the section imports and of
+the data files those modules name; when the fingerprint still matches, the
+section is not compiled again. It is still constructed, so the page keeps
+collecting its state usage, npm imports, app wrappers and custom components;
+every section is eligible, including those that read server state.
+
+This module calls private Reflex compiler APIs and only supports the Reflex
+version pinned in requirements.txt.
+"""
+import ast
+import hashlib
+import importlib
+import importlib.util
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from reflex import constants
+
+from .common import ROOT_DIR
+
+SUPPORTED_REFLEX = "0.6.7"
+
+try:
+    from reflex.compiler.compiler import _compile_page
+    from reflex.components.component import Component, StatefulComponent
+    from reflex.utils.imports import merge_imports
+
+    if not hasattr(Component, "_add_style_recursive") or not hasattr(StatefulComponent, "compile_from"):
+        raise ImportError("Component._add_style_recursive or StatefulComponent.compile_from is gone")
+except ImportError as error:
+    raise ImportError(
+        f"Incremental builds rely on private Reflex {SUPPORTED_REFLEX} compiler APIs, which Reflex "
+        f"{constants.Reflex.VERSION} does not provide ({error}); install reflex=={SUPPORTED_REFLEX} "
+        "or unset PORTFOLIO_INCREMENTAL."
+    ) from error
+
+PACKAGE = "Portfolio"
+
+# Under utils/ so Tailwind, which scans .web/utils, still sees the section classes.
+SECTIONS_DIR = ROOT_DIR / constants.Dirs.WEB / constants.Dirs.UTILS / "sections"
+
+FINGERPRINT_PREFIX = "// fingerprint: "
+
+# Files that change what every section compiles to.
+GLOBAL_INPUTS = (ROOT_DIR / "rxconfig.py",)
+
+
+def module_path(module_name: str):
+    """Return the source file of a Portfolio module, or None for names that are not modules."""
+    base = ROOT_DIR.joinpath(*module_name.split("."))
+    for path in (base.with_suffix(".py"), base / "__init__.py"):
+        if path.is_file():
+            return path
+    return None
+
+
+def module_imports(module_name: str) -> set:
+    """Return the Portfolio modules a module imports directly."""
+    path = module_path(module_name)
+    return parse_imports(module_name, path, path.stat().st_mtime_ns)
+
+
+def top_level_statements(body):
+    """Yield the statements that run on import, descending into if/try/with blocks but not
+    into functions or classes."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.If, ast.With, ast.For, ast.While)):
+            yield from top_level_statements(node.body)
+            yield from top_level_statements(getattr(node, "orelse", []))
+        elif isinstance(node, ast.Try):
+            for block in (node.body, node.orelse, node.finalbody):
+                yield from top_level_statements(block)
+            for handler in node.handlers:
+                yield from top_level_statements(handler.body)
+
+
+# Keyed on the modification time so a watcher re-parses only edited modules.
+@lru_cache(maxsize=None)
+def parse_imports(module_name: str, path: Path, mtime: int) -> frozenset:
+    """Collect the Portfolio modules one version of a module's source imports when it loads.
+
+    Imports inside functions, such as build.common's lazy `from ..Portfolio import app`,
+    do not affect what a section compiles to and are left out.
+    """
+    package = module_name if path.name == "__init__.py" else module_name.rpartition(".")[0]
+    imports = set()
+    for node in top_level_statements(ast.parse(path.read_text(encoding="utf-8")).body):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                base = importlib.util.resolve_name("." * node.level + base, package)
+            # `from . import assets` names submodules rather than attributes.
+            names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        imports.update(
+            name for name in names
+            if name.split(".")[0] == PACKAGE and name != module_name and module_path(name)
+        )
+    return frozenset(imports)
+
+
+def imported_modules(module_name: str, seen: set = None) -> set:
+    """Return the Portfolio modules a module imports, directly or not, itself included."""
+    seen = set() if seen is None else seen
+    seen.add(module_name)
+    for name in module_imports(module_name):
+        if name not in seen:
+            imported_modules(name, seen)
+    return seen
+
+
+def content_files(module_names) -> list:
+    """Files named by module-level Path constants, such as catalogs and build manifests."""
+    files = set()
+    for module_name in module_names:
+        for value in vars(importlib.import_module(module_name)).values():
+            if isinstance(value, Path) and value.suffix:
+                files.add(value)
+    return sorted(files)
+
+
+def fingerprint(module_name: str) -> str:
+    """Hash the sources and content a section is built from, plus the settings it depends on."""
+    modules = imported_modules(module_name)
+    digest = hashlib.sha256(constants.Reflex.VERSION.encode())
+    for name, value in sorted(os.environ.items()):
+        if name.startswith("PORTFOLIO_"):
+            digest.update(f"{name}={value}".encode())
+    paths = [module_path(name) for name in sorted(modules)]
+    for path in [*GLOBAL_INPUTS, *paths, *content_files(modules)]:
+        digest.update(str(path).encode())
+        digest.update(path.read_bytes() if path.is_file() else b"<missing>")
+    return digest.hexdigest()[:16]
+
+
+class SectionModule(Component):
+    """A section rendered from its precompiled module in .web/utils/sections.
+
+    Its markup and hooks live in the module. What the app collects from the page tree
+    (imports to install, app wrappers, custom components, whether state is used) comes
+    from the constructed section, so a cached section builds the same app as a fresh one.
+    """
+
+    is_default = True
+
+    _section_imports: dict = {}
+    _section_app_wraps: dict = {}
+    _section_custom_components: set = set()
+    _section_vars: list = []
+    _section_uses_state: bool = False
+
+    @classmethod
+    def create(cls, section_id: str, section: Component) -> Component:
+        """Import the section's module and take over what the app needs from the section."""
+        module = super().create(
+            library=f"$/{constants.Dirs.UTILS}/sections/{section_id}",
+            tag="Section" + "".join(part.title() for part in section_id.split("_")),
+        )
+        # Collected before memoization, which hides the memoized subtrees from these walks.
+        module._section_imports = section._get_all_imports()
+        module._section_app_wraps = section._get_all_app_wrap_components()
+        module._section_custom_components = section._get_all_custom_components()
+        module._section_vars = section._get_vars(include_children=True)
+        module._section_uses_state = section._has_stateful_event_triggers()
+        return module
+
+    def _get_all_imports(self, collapse: bool = False):
+        return merge_imports(super()._get_all_imports(collapse), self._section_imports)
+
+    def _get_all_app_wrap_components(self) -> dict:
+        return {**super()._get_all_app_wrap_components(), **self._section_app_wraps}
+
+    def _get_all_custom_components(self, seen: set = None) -> set:
+        return super()._get_all_custom_components(seen) | self._section_custom_components
+
+    def _get_vars(self, include_children: bool = False) -> list:
+        own = super()._get_vars(include_children)
+        return [*own, *self._section_vars] if include_children else own
+
+    def _has_stateful_event_triggers(self) -> bool:
+        return self._section_uses_state or super()._has_stateful_event_triggers()
+
+
+def build_section(create) -> Component:
+    """Construct a section and apply the page's (empty) style, as the app does to its pages."""
+    component = create()
+    component._add_style_recursive({})
+    return component
+
+
+def compile_component(component: Component) -> str:
+    """Compile a constructed section into a module whose default export renders it."""
+    component = StatefulComponent.compile_from(component) or component
+    return _compile_page(component, None)
+
+
+def compile_section(create) -> str:
+    """Build a section and compile it into a module whose default export renders it."""
+    return compile_component(build_section(create))
+
+
+def refresh_section(section_id: str, create, component: Component = None) -> bool:
+    """Recompile the section's module if its fingerprint changed; return whether it did.
+    The section is constructed only when stale, unless the caller already built it."""
+    path = SECTIONS_DIR / f"{section_id}.js"
+    header = f"{FINGERPRINT_PREFIX}{fingerprint(create.__module__)}\n"
+    if path.exists() and path.read_text(encoding="utf-8").startswith(header):
+        return False
+    component = build_section(create) if component is None else component
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(header + compile_component(component), encoding="utf-8")
+    return True
+
+
+def section_module(section_id: str, create) -> Component:
+    """Return a component importing the section's module, recompiling the module only when stale.
+    The section is always constructed; only its compile step is cached."""
+    section = build_section(create)
+    module = SectionModule.create(section_id, section)
+    refresh_section(section_id, create, section)
+    return module
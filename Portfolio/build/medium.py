@@ -0,0 +1,184 @@
+"""Turn the Medium RSS feed into blog cards with excerpts and vendored thumbnails, reusing cached posts."""
+import hashlib
+import json
+import sys
+import urllib.request
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from ..data.posts import POSTS_PATH
+from ..utils.assets import ASSETS_DIR
+from .assets import REQUEST_TIMEOUT, USER_AGENT, vendor_image
+from .common import ROOT_DIR, write_manifest
+
+FEED_URL = "https://medium.com/feed/@VforVitorio"
+
+# Processed posts keyed by a hash of their feed entry; a post is only reprocessed when it changes.
+CACHE_DIR = ROOT_DIR / ".cache" / "medium"
+
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+EXCERPT_LENGTH = 200
+MAX_POSTS = 6
+
+
+def is_tracking_pixel(attributes: dict) -> bool:
+    """Spot the 1x1 medium.com/_/stat image Medium appends to every feed item."""
+    return (
+        "/_/stat" in (attributes.get("src") or "")
+        or attributes.get("width") == "1"
+        or attributes.get("height") == "1"
+    )
+
+
+class ContentScanner(HTMLParser):
+    """Collect the body text and the first image, tracking pixels aside, of a post's HTML."""
+
+    # Headings repeat the title on Medium; captions and code are not prose.
+    SKIPPED_TAGS = {"h1", "h2", "h3", "h4", "figcaption", "pre", "script", "style"}
+
+    def __init__(self):
+        super().__init__()
+        self.text = []
+        self.image = None
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self.skipping += 1
+        elif tag == "img" and self.image is None:
+            attributes = dict(attrs)
+            if not is_tracking_pixel(attributes):
+                self.image = attributes.get("src")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self.skipping:
+            self.skipping -= 1
+        # Keep words of adjacent blocks apart.
+        self.text.append(" ")
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.text.append(data)
+
+
+def excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """Collapse whitespace and cut at a word boundary."""
+    text = " ".join(text.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0].rstrip(",.;:") + "…"
+
+
+def open_feed(source: str):
+    """Open the feed URL or local XML file as a binary stream."""
+    if urlsplit(source).scheme in ("http", "https"):
+        request = urllib.request.Request(source, headers={"User-Agent": USER_AGENT})
+        return urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT)
+    return open(source, "rb")
+
+
+def iter_entries(stream):
+    """Yield each <item> of an RSS stream as a dict, discarding it once read."""
+    for _, element in ET.iterparse(stream, events=("end",)):
+        if element.tag != "item":
+            continue
+        yield {
+            "guid": element.findtext("guid") or element.findtext("link") or "",
+            "title": (element.findtext("title") or "").strip(),
+            "link": (element.findtext("link") or "").strip(),
+            "published": element.findtext("pubDate") or "",
+            "content": element.findtext(CONTENT_ENCODED) or element.findtext("description") or "",
+        }
+        # Keep memory flat however long the feed is.
+        element.clear()
+
+
+def entry_key(entry: dict) -> str:
+    """Content address of a feed entry."""
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def process_entry(entry: dict, fixtures_dir: Path = None) -> tuple:
+    """Build the card data of one post, vendoring its first image as the thumbnail.
+
+    Returns (post, complete); incomplete posts are retried on the next build.
+    """
+    scanner = ContentScanner()
+    scanner.feed(entry["content"])
+    thumbnail = None
+    complete = True
+    if scanner.image:
+        try:
+            thumbnail = vendor_image(scanner.image, fixtures_dir)
+        except (OSError, ValueError) as error:
+            print(f"Could not vendor thumbnail {scanner.image}: {error}", file=sys.stderr)
+            complete = False
+    try:
+        published = parsedate_to_datetime(entry["published"]) if entry["published"] else None
+    except (TypeError, ValueError):
+        print(f"Ignoring malformed pubDate {entry['published']!r} of {entry['link']}", file=sys.stderr)
+        published = None
+    return {
+        "title": entry["title"],
+        "href": entry["link"],
+        "published": published.date().isoformat() if published else "",
+        "date": f"{published:%b} {published.day}, {published.year}" if published else "",
+        "excerpt": excerpt("".join(scanner.text)),
+        "thumbnail": thumbnail,
+    }, complete
+
+
+def cached_post(key: str):
+    """Return a processed post from the cache, unless its thumbnail has gone missing."""
+    path = CACHE_DIR / f"{key}.json"
+    if not path.exists():
+        return None
+    post = json.loads(path.read_text(encoding="utf-8"))
+    if post["thumbnail"] and not (ASSETS_DIR / post["thumbnail"].lstrip("/")).exists():
+        return None
+    return post
+
+
+def configure(parser):
+    parser.add_argument("--feed", default=FEED_URL, help="Feed URL or local RSS file.")
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Read thumbnails from this directory (<host>/<path>) instead of the network.",
+    )
+
+
+def run(args) -> int:
+    posts = []
+    keys = set()
+    processed = 0
+    try:
+        with open_feed(args.feed) as stream:
+            for entry in iter_entries(stream):
+                key = entry_key(entry)
+                keys.add(key)
+                post = cached_post(key)
+                if post is None:
+                    post, complete = process_entry(entry, args.fixtures)
+                    if complete:
+                        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                        (CACHE_DIR / f"{key}.json").write_text(json.dumps(post), encoding="utf-8")
+                    processed += 1
+                posts.append(post)
+    except (OSError, ET.ParseError) as error:
+        # Keep the previous posts rather than emptying the blog section.
+        print(f"Could not read {args.feed}: {error}", file=sys.stderr)
+        return 1
+
+    for stale in CACHE_DIR.glob("*.json"):
+        if stale.stem not in keys:
+            stale.unlink()
+    posts.sort(key=lambda post: post["published"], reverse=True)
+    write_manifest(POSTS_PATH, {"posts": posts[:MAX_POSTS]})
+    print(f"Wrote {min(len(posts), MAX_POSTS)} posts ({processed} processed, "
+          f"{len(posts) - processed} cached) to {POSTS_PATH.name}")
+    return 0
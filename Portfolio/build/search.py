@@ -0,0 +1,94 @@
+"""Tokenize the project cards into a prebuilt inverted index that the search box queries in the browser."""
+import json
+import re
+import unicodedata
+from collections import Counter
+
+from ..data.catalog import load_projects
+from ..utils.assets import SEARCH_DIR, SEARCH_MANIFEST
+from .common import hashed_filename, public_path, write_manifest
+
+# Points per occurrence of a term in each field; a title hit outranks a passing mention in the details.
+FIELD_WEIGHTS = {"title": 8, "technologies_used": 5, "description": 3, "details": 1}
+
+# Occurrences counted per field, so long detail texts cannot drown out the title.
+MAX_OCCURRENCES = 3
+
+# Shorter terms are not indexed; the browser drops them from queries too.
+MIN_TERM_LENGTH = 2
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it its of on or that the this to with".split()
+)
+
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def tokenize(text: str) -> list:
+    """Split text into lower-case ASCII terms; the search box normalizes queries the same way."""
+    text = "".join(
+        char for char in unicodedata.normalize("NFD", text.lower())
+        if not unicodedata.combining(char)
+    )
+    return [
+        term for term in NON_WORD.split(text)
+        if len(term) >= MIN_TERM_LENGTH and term not in STOPWORDS
+    ]
+
+
+def details_text(details: dict) -> str:
+    """Join the searchable text of a project's details."""
+    return " ".join([
+        details["detailed_description"],
+        *details["key_features"],
+        *details["development_contributions"],
+        *details["research_contributions"],
+    ])
+
+
+def build_index(projects) -> dict:
+    """Build {"ids", "terms", "postings", "stopwords", "min_length"}: terms sorted for prefix
+    lookup, each with a flat [project index, score, ...] posting list aligned to it, and the
+    rules the browser applies to queries so they drop what tokenize() dropped."""
+    scores = {}
+    for index, project in enumerate(projects):
+        fields = {**project, "details": details_text(project["details"])}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term, count in Counter(tokenize(fields[field])).items():
+                postings = scores.setdefault(term, {})
+                postings[index] = postings.get(index, 0) + weight * min(count, MAX_OCCURRENCES)
+    terms = sorted(scores)
+    return {
+        "ids": [project["id"] for project in projects],
+        "terms": terms,
+        "postings": [
+            [value for item in sorted(scores[term].items()) for value in item] for term in terms
+        ],
+        "stopwords": sorted(STOPWORDS),
+        "min_length": MIN_TERM_LENGTH,
+    }
+
+
+def write_search_index(projects) -> str:
+    """Write the search index as a content-hashed JSON file and return its public path."""
+    data = json.dumps(build_index(projects), separators=(",", ":")).encode("utf-8")
+    target = SEARCH_DIR / hashed_filename("projects", data, ".json")
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    for stale in SEARCH_DIR.glob("projects.*.json"):
+        if stale != target:
+            stale.unlink()
+    write_manifest(SEARCH_MANIFEST, {"index": public_path(target)})
+    return public_path(target)
+
+
+def configure(parser):
+    pass
+
+
+def run(args) -> int:
+    path = write_search_index(load_projects())
+    size = (SEARCH_DIR / path.rpartition("/")[2]).stat().st_size
+    print(f"Wrote {path} ({size} bytes)")
+    return 0
@@ -0,0 +1,180 @@
+"""Serve the exported site as the CDN would: cache-manifest headers, precompressed encodings and byte ranges."""
+import json
+import re
+import sys
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from .export import MANIFEST_NAME, STATIC_DIR
+
+# Preferred first when the browser accepts both equally.
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Suffixes that keep each encoded body's ETag distinct from the identity body's.
+ENCODING_ETAGS = {"br": "-br", "gzip": "-gz"}
+
+BYTE_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+CHUNK_SIZE = 64 * 1024
+
+
+def parse_range(header: str, size: int):
+    """Resolve a single `bytes=start-end` range to inclusive offsets; None if unsatisfiable."""
+    match = BYTE_RANGE.match(header.strip())
+    if match is None or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if not start:
+        # A suffix range: the last N bytes.
+        length = int(end)
+        return (max(size - length, 0), size - 1) if length else None
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    return (start, end) if start <= end else None
+
+
+def accepted_encodings(header: str) -> dict:
+    """Parse Accept-Encoding into {coding: q-value}; "*" stands for every coding not listed."""
+    accepted = {}
+    for item in header.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def choose_encoding(header: str, available) -> str:
+    """Pick the available encoding with the highest non-zero q-value, or None for identity."""
+    accepted = accepted_encodings(header)
+    best, best_q = None, 0.0
+    for name in ENCODING_SUFFIXES:
+        q = accepted.get(name, accepted.get("*", 0.0))
+        if name in available and q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class ExportHandler(SimpleHTTPRequestHandler):
+    """Static file handler driven by the export stage's cache manifest."""
+
+    # Keep-alive, so a PDF viewer's successive range requests reuse one connection.
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args, manifest: dict, **kwargs):
+        self.manifest = manifest
+        super().__init__(*args, **kwargs)
+
+    def resolve(self):
+        """Map the request path to an exported file and its manifest key, trying Next.js page names."""
+        path = unquote(urlsplit(self.path).path)
+        for candidate in (path, f"{path.rstrip('/')}.html", f"{path.rstrip('/')}/index.html"):
+            file = Path(self.directory) / candidate.lstrip("/")
+            if candidate in self.manifest and file.is_file():
+                return candidate, file
+        return None, None
+
+    def send_file_head(self):
+        """Send the status and headers for the request; return (file, start, end) or None."""
+        key, file = self.resolve()
+        if key is None:
+            key, file = "/404.html", Path(self.directory) / "404.html"
+            if not file.is_file():
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return None
+            status = HTTPStatus.NOT_FOUND
+        else:
+            status = HTTPStatus.OK
+        entry = self.manifest.get(key, {})
+        size = file.stat().st_size
+        etag = f'"{size:x}-{int(file.stat().st_mtime):x}"'
+        byte_range = None
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if status == HTTPStatus.OK and range_header and (if_range is None or if_range == etag):
+            byte_range = parse_range(range_header, size)
+            if byte_range is None:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+        encoding = None
+        if byte_range is None:
+            encoding = choose_encoding(
+                self.headers.get("Accept-Encoding", ""), entry.get("encodings", []))
+        if encoding:
+            # Ranges always address the identity bytes, so compressed bodies are sent whole.
+            file = file.with_name(file.name + ENCODING_SUFFIXES[encoding])
+            size = file.stat().st_size
+            # Each encoded body is its own representation with its own strong validator.
+            etag = etag[:-1] + ENCODING_ETAGS[encoding] + '"'
+
+        start, end = byte_range or (0, size - 1)
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if byte_range else status)
+        self.send_header("Content-Type", entry.get("content_type", "application/octet-stream"))
+        self.send_header("Cache-Control", entry.get("cache_control", "no-cache"))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        else:
+            self.send_header("Accept-Ranges", "bytes")
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        return file, start, end
+
+    def do_HEAD(self):
+        self.send_file_head()
+
+    def do_GET(self):
+        head = self.send_file_head()
+        if head is None:
+            return
+        file, start, end = head
+        with open(file, "rb") as stream:
+            stream.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = stream.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+def configure(parser):
+    parser.add_argument("--static-dir", type=Path, default=STATIC_DIR)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+
+
+def run(args) -> int:
+    manifest_path = args.static_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        print(f"No {MANIFEST_NAME} in {args.static_dir}; run `python -m Portfolio.build export` first.",
+              file=sys.stderr)
+        return 1
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+    handler = partial(ExportHandler, manifest=manifest, directory=str(args.static_dir))
+    with ThreadingHTTPServer((args.host, args.port), handler) as server:
+        print(f"Serving {args.static_dir} on http://{args.host}:{args.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
@@ -0,0 +1,193 @@
+"""Bundle every SVG icon drawn with styles.create_sprite_icon into one minified, content-hashed sprite."""
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlsplit
+
+from ..utils.assets import ICONS_DIR, SPRITE_ICONS, SPRITE_MANIFEST
+from .assets import fetch
+from .common import hashed_filename, public_path, write_manifest
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+ET.register_namespace("", SVG_NS)
+
+# Elements only useful in a standalone file; the <use> site carries the label.
+DROPPED_TAGS = {"title", "desc", "metadata"}
+
+# Attributes of an icon's root <svg> that a <symbol> sizes through its viewBox instead.
+DROPPED_ROOT_ATTRIBUTES = {"width", "height", "x", "y", "version", "enable-background"}
+
+# Decimal places kept in path data; icons render at a few dozen pixels.
+PATH_PRECISION = 2
+
+PATH_TOKEN = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[A-Za-z]")
+ID_REFERENCE = re.compile(r"url\(#([^)]+)\)")
+LENGTH = re.compile(r"[\d.]+")
+
+
+def local_name(name: str) -> tuple:
+    """Split an ElementTree name into (namespace, local name)."""
+    if name.startswith("{"):
+        namespace, _, local = name[1:].partition("}")
+        return namespace, local
+    return "", name
+
+
+def format_number(value: float) -> str:
+    """Print a coordinate with at most PATH_PRECISION decimals and no redundant zeros."""
+    text = f"{round(value, PATH_PRECISION):.{PATH_PRECISION}f}".rstrip("0").rstrip(".")
+    if text in ("-0", ""):
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def minify_path(d: str) -> str:
+    """Round the numbers of a path and drop the separators the grammar does not need."""
+    # Arc flags may be packed together ("011"), which a number tokenizer would misread.
+    if re.search(r"[Aa]", d):
+        return " ".join(d.split())
+    output = ""
+    for token in PATH_TOKEN.findall(d):
+        if token.isalpha():
+            output += token
+            continue
+        number = format_number(float(token))
+        previous = output[-1:]
+        # "1 2" needs a space, "1-2" does not, and ".5" only follows a number without a dot.
+        needs_space = previous.isdigit() or previous == "."
+        if number.startswith("-"):
+            needs_space = False
+        elif number.startswith(".") and needs_space:
+            last_number = re.split(r"[^\d.]", output)[-1]
+            needs_space = "." not in last_number
+        output += (" " if needs_space else "") + number
+    return output
+
+
+def view_box(root) -> str:
+    """Return the icon's viewBox, deriving it from width and height when missing."""
+    if root.get("viewBox"):
+        return " ".join(root.get("viewBox").replace(",", " ").split())
+    width = LENGTH.match(root.get("width", ""))
+    height = LENGTH.match(root.get("height", ""))
+    if not (width and height):
+        raise ValueError("SVG has neither a viewBox nor a numeric width and height")
+    return f"0 0 {width.group(0)} {height.group(0)}"
+
+
+def clean_element(element, prefix: str):
+    """Strip editor cruft, minify paths and namespace ids in place, recursively."""
+    for child in list(element):
+        namespace, tag = local_name(child.tag)
+        if namespace != SVG_NS or tag in DROPPED_TAGS:
+            element.remove(child)
+            continue
+        clean_element(child, prefix)
+
+    for name, value in list(element.attrib.items()):
+        namespace, attribute = local_name(name)
+        del element.attrib[name]
+        if namespace == XLINK_NS and attribute == "href":
+            attribute = "href"
+        elif namespace:
+            continue
+        if attribute == "id":
+            value = f"{prefix}-{value}"
+        elif attribute == "href" and value.startswith("#"):
+            value = f"#{prefix}-{value[1:]}"
+        elif attribute == "d":
+            value = minify_path(value)
+        value = ID_REFERENCE.sub(lambda match: f"url(#{prefix}-{match.group(1)})", value)
+        element.set(attribute, value)
+
+    if element.text is not None:
+        element.text = element.text.strip() or None
+    element.tail = None
+
+
+def build_symbol(data: bytes, symbol_id: str):
+    """Turn one SVG document into a <symbol> whose internal ids are prefixed with its own."""
+    root = ET.fromstring(data)
+    if local_name(root.tag) != (SVG_NS, "svg"):
+        raise ValueError("not an SVG document")
+    box = view_box(root)
+    clean_element(root, symbol_id)
+    symbol = ET.Element(f"{{{SVG_NS}}}symbol")
+    symbol.set("id", symbol_id)
+    symbol.set("viewBox", box)
+    for name, value in root.attrib.items():
+        if name not in DROPPED_ROOT_ATTRIBUTES and name not in ("id", "viewBox", "xmlns"):
+            symbol.set(name, value)
+    symbol.extend(root)
+    return symbol
+
+
+def unique_id(url: str, taken: set) -> str:
+    """Derive a readable symbol id from the URL, numbering repeats."""
+    stem = PurePosixPath(urlsplit(url).path).stem or urlsplit(url).netloc
+    base = re.sub(r"[^A-Za-z0-9_-]+", "-", stem).strip("-").lower() or "icon"
+    symbol_id = base
+    count = 1
+    while symbol_id in taken:
+        count += 1
+        symbol_id = f"{base}-{count}"
+    return symbol_id
+
+
+def build_sprite(sources: list, fixtures_dir: Path = None) -> tuple:
+    """Fetch the icons and return (sprite bytes, {url: symbol id}, failed URLs)."""
+    sprite = ET.Element(f"{{{SVG_NS}}}svg")
+    icons = {}
+    # The same file under two URLs becomes a single symbol.
+    symbol_ids = {}
+    failed = []
+    for url in sources:
+        try:
+            data, _ = fetch(url, fixtures_dir)
+            if data not in symbol_ids:
+                symbol_id = unique_id(url, set(symbol_ids.values()))
+                sprite.append(build_symbol(data, symbol_id))
+                symbol_ids[data] = symbol_id
+        except (OSError, ValueError, ET.ParseError) as error:
+            print(f"Could not add {url} to the sprite: {error}", file=sys.stderr)
+            failed.append(url)
+            continue
+        icons[url] = symbol_ids[data]
+    data = ET.tostring(sprite, encoding="utf-8", xml_declaration=False)
+    return data.replace(b" />", b"/>"), icons, failed
+
+
+def write_sprite(data: bytes) -> str:
+    """Store the sprite under a content-hashed name, removing older builds, and return its path."""
+    target = ICONS_DIR / hashed_filename("sprite", data, ".svg")
+    for stale in ICONS_DIR.glob("sprite.*.svg"):
+        if stale != target:
+            stale.unlink()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+    return public_path(target)
+
+
+def configure(parser):
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Read icons from this directory (<host>/<path>) instead of the network.",
+    )
+
+
+def run(args) -> int:
+    from ..views.index import index
+
+    index()
+    data, icons, failed = build_sprite(SPRITE_ICONS, args.fixtures)
+    write_manifest(SPRITE_MANIFEST, {"sprite": write_sprite(data), "icons": icons})
+    print(f"Bundled {len(icons)} icons into {len(data)} bytes under {ICONS_DIR}")
+    return 1 if failed else 0
@@ -0,0 +1,177 @@
+"""Watch section sources and patch content-only edits into the running dev frontend without a full recompile."""
+import ast
+import importlib
+import sys
+import time
+from functools import lru_cache
+from graphlib import TopologicalSorter
+from pathlib import Path
+
+from ..utils.assets import load_manifest
+from .common import ROOT_DIR
+from .incremental import (
+    GLOBAL_INPUTS,
+    PACKAGE,
+    SECTIONS_DIR,
+    compile_section,
+    content_files,
+    imported_modules,
+    module_imports,
+    module_path,
+    refresh_section,
+)
+
+# Seconds between polls of the watched files' modification times.
+POLL_INTERVAL = 0.1
+
+# Modules that cannot be re-executed in place: reloading a state module redefines its State class.
+UNRELOADABLE_PREFIXES = ("Portfolio.state",)
+
+
+class LiteralMask(ast.NodeTransformer):
+    """Replace every literal expression with a placeholder so that only code structure is compared."""
+
+    def visit(self, node):
+        if isinstance(node, ast.expr):
+            try:
+                ast.literal_eval(node)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                return super().visit(node)
+            return ast.copy_location(ast.Constant(value=...), node)
+        return super().visit(node)
+
+
+@lru_cache(maxsize=None)
+def code_shape(path: Path, mtime: int) -> str:
+    """Dump a module's AST with strings, numbers and literal tables masked out."""
+    return ast.dump(LiteralMask().visit(ast.parse(path.read_text(encoding="utf-8"))))
+
+
+def section_creators() -> dict:
+    """Return each section's build function, looked up again so reloaded modules are used."""
+    # Imported here so the other build stages do not load the page components.
+    from ..views.index import SECTIONS
+
+    return {
+        section_id: getattr(sys.modules[section["create"].__module__], section["create"].__name__)
+        for section_id, section in SECTIONS.items()
+    }
+
+
+class SectionWatcher:
+    """Track the files each section is built from and the code shape of its modules."""
+
+    def __init__(self):
+        self.scan()
+
+    def scan(self):
+        """Record the section modules, the files they read and their modification times."""
+        self.modules = set()
+        for create in section_creators().values():
+            self.modules |= imported_modules(create.__module__)
+        self.imports = {name: module_imports(name) & self.modules for name in self.modules}
+        self.readers = {}
+        for name in self.modules:
+            for path in content_files([name]):
+                self.readers.setdefault(path, set()).add(name)
+        self.sources = {module_path(name): name for name in self.modules}
+        self.shapes = {name: code_shape(path, self.mtime(path)) for path, name in self.sources.items()}
+        # Every other source is watched too, to report edits that need a full compile.
+        watched = [*GLOBAL_INPUTS, *self.sources, *self.readers, *(ROOT_DIR / PACKAGE).rglob("*.py")]
+        self.mtimes = {path: self.mtime(path) for path in watched}
+
+    @staticmethod
+    def mtime(path):
+        return path.stat().st_mtime_ns if path.exists() else None
+
+    def changed_files(self) -> list:
+        """Return the watched files modified since the last poll."""
+        changed = []
+        for path, mtime in self.mtimes.items():
+            current = self.mtime(path)
+            if current != mtime:
+                self.mtimes[path] = current
+                changed.append(path)
+        return changed
+
+    def structural_changes(self, changed) -> list:
+        """Return the changed files a fast reload cannot apply safely."""
+        structural = []
+        for path in changed:
+            name = self.sources.get(path)
+            if path in self.readers and name is None:
+                continue
+            if name is None or name.startswith(UNRELOADABLE_PREFIXES):
+                structural.append(path)
+            elif code_shape(path, self.mtime(path)) != self.shapes[name]:
+                structural.append(path)
+        return structural
+
+    def stale_modules(self, changed) -> list:
+        """Return the modules to reload, dependencies first: edited modules, readers of
+        edited files, and every section module importing them."""
+        stale = {self.sources[path] for path in changed if path in self.sources}
+        for path in changed:
+            stale |= self.readers.get(path, set())
+        dependents = True
+        while dependents:
+            dependents = {
+                name for name, imports in self.imports.items() if imports & stale and name not in stale
+            }
+            stale |= dependents
+        order = TopologicalSorter({name: self.imports[name] & stale for name in stale})
+        return list(order.static_order())
+
+
+def patch(watcher: SectionWatcher, changed) -> int:
+    """Reload the modules behind a content edit and rewrite the stale section modules."""
+    started = time.perf_counter()
+    for name in watcher.stale_modules(changed):
+        importlib.reload(sys.modules[name])
+    load_manifest.cache_clear()
+    patched = [
+        section_id
+        for section_id, create in section_creators().items()
+        if refresh_section(section_id, create)
+    ]
+    watcher.scan()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"Patched {', '.join(patched) or 'no sections'} in {elapsed:.0f} ms")
+    return len(patched)
+
+
+def configure(parser):
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL,
+                        help="Seconds between checks for modified files.")
+
+
+def run(args) -> int:
+    if not SECTIONS_DIR.exists():
+        print("No section modules to patch; start the dev server with PORTFOLIO_INCREMENTAL=1 first.",
+              file=sys.stderr)
+        return 1
+    watcher = SectionWatcher()
+    # Bring the modules up to date with edits made before the watcher started.
+    patch(watcher, [])
+    # Compile every section once so the first patch does not pay for Reflex's lazy imports.
+    for create in section_creators().values():
+        compile_section(create)
+    print(f"Watching {len(watcher.mtimes)} files; press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(args.interval)
+            changed = watcher.changed_files()
+            if not changed:
+                continue
+            try:
+                structural = watcher.structural_changes(changed)
+                if structural:
+                    names = ", ".join(str(path.relative_to(ROOT_DIR)) for path in structural)
+                    print(f"Cannot patch {names} in place; restart `reflex run` for a full compile.")
+                    watcher.scan()
+                else:
+                    patch(watcher, changed)
+            except Exception as error:  # An edit in progress may not parse or build yet.
+                print(f"Could not patch: {error}", file=sys.stderr)
+    except KeyboardInterrupt:
+        return 0
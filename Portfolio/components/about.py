@@ -1,5 +1,7 @@
 import reflex as rx
-from ..utils.styles import create_styled_heading
+from ..utils.styles import create_container, create_sprite_icon, create_styled_heading
+from ..utils.assets import asset_src
+from ..utils.highlight import highlight_text
 
 # Directly defined constants in the file
 LINKEDIN_URL = "https://www.linkedin.com/in/victorvegasobral/"
@@ -11,7 +13,7 @@ def create_logo_image(alt_text, image_src):
     """Create a logo image with specified dimensions and alt text."""
     return rx.image(
         alt=alt_text,
-        src=image_src,
+        src=asset_src(image_src),
         height="3rem",
         margin_right="1rem",
         object_fit="contain",
@@ -42,41 +44,13 @@ def create_info_box(title, subtitle, description):
 def create_skill_item(icon_src: str, skill_text: str):
     """Create a skill item with an icon and text."""
     return rx.hstack(
-        rx.image(
-            src=icon_src,
-            height="1.5rem",
-            width="1.5rem",
-            object_fit="contain",
-            alt=f"{skill_text} icon",
-        ),
+        create_sprite_icon(icon_src, alt=f"{skill_text} icon"),
         rx.text(skill_text),
         spacing="3",
         align_items="center",
     )
 
 
-def highlight_text(text: str) -> str:
-    """Add color spans to highlighted keywords."""
-    keywords = {
-        "Python": "rgb(96, 165, 250)",
-        "PyTorch": "rgb(239, 68, 68)",
-        "TensorFlow": "rgb(255, 128, 0)",
-        "Deep Learning": "rgb(139, 92, 246)",
-        "AI": "rgb(0, 150, 150)",
-        "Intelligent Systems Engineering": "rgb(45, 155, 245)",
-        "Engineering Summer Programme alumnus at Girton College, Cambridge University": "rgb(0, 84, 166)",
-        "IELTS 8": "rgb(0, 84, 166)",
-        "F1": "rgb(255, 0, 0)",
-    }
-
-    for keyword, color in keywords.items():
-        text = text.replace(
-            keyword,
-            f'<span style="color: {color}; font-weight: 600;">{keyword}</span>'
-        )
-    return text
-
-
 def create_about_summary():
     """Create the professional summary and expertise section for the About Me page."""
     return rx.box(
@@ -124,7 +98,7 @@ def create_about_summary():
                     "TensorFlow"
                 ),
                 create_skill_item(
-                    "https://cdn-lfs.hf.co/repos/96/a2/96a2c8468c1546e660ac2609e49404b8588fcf5a748761fa72c154b2836b4c83/e24efa64f0482c4484c47bf9394e8b46182a2a3b66fd017c9293bef8754abb66?response-content-disposition=inline%3B+filename*%3DUTF-8%27%27hf-logo.svg%3B+filename%3D\"hf-logo.svg\"%3B&response-content-type=image%2Fsvg%2Bxml&Expires=1747937607&Policy=eyJTdGF0ZW1lbnQiOlt7IkNvbmRpdGlvbiI6eyJEYXRlTGVzc1RoYW4iOnsiQVdTOkVwb2NoVGltZSI6MTc0NzkzNzYwN319LCJSZXNvdXJjZSI6Imh0dHBzOi8vY2RuLWxmcy5oZi5jby9yZXBvcy85Ni9hMi85NmEyYzg0NjhjMTU0NmU2NjBhYzI2MDllNDk0MDRiODU4OGZjZjVhNzQ4NzYxZmE3MmMxNTRiMjgzNmI0YzgzL2UyNGVmYTY0ZjA0ODJjNDQ4NGM0N2JmOTM5NGU4YjQ2MTgyYTJhM2I2NmZkMDE3YzkyOTNiZWY4NzU0YWJiNjY~cmVzcG9uc2UtY29udGVudC1kaXNwb3NpdGlvbj0qJnJlc3BvbnNlLWNvbnRlbnQtdHlwZT0qIn1dfQ__&Signature=MgItVMuikszf4ww~X3GtsHeEoUVBWY0NwoUgAOagD0FDOyw-oHTPvFDduefLOM5jajmdTftNkYU5-aScHX67JIWJJzt0ZRNGGKQy4PnmE8SGwCt75VEgbkLl8rHssDaTenF4RzpfTuzZ8ePHgAooBhUo4vf6uQIilBSwNVmV2OD9llNDyWfAv5S9jeUmoC6mmaneqJABrx2z8vPY5E3XjDBMU2aF6fvt3f1Xy2Th3Covg-3Le8Rt2~VKWVUOxxqAXRojPen5QlVb~mY~G--hAyMc88MaGnoC9GlDS1HOGtLn9PsiRVTGsQCUxjRlrT4JN2WVcJWQoYhAp5zS3~BaPA__&Key-Pair-Id=K3RPWS32NSSJCE",
+                    "https://huggingface.co/front/assets/huggingface_logo-noborder.svg",
                     "Hugging Face"
                 ),
                 create_skill_item(
@@ -209,7 +183,7 @@ def create_list_item(item_text):
 
 def create_about_section():
     """Create the 'About Me' section with expertise and professional journey."""
-    return rx.box(
+    return create_container(
         create_section_heading(heading_text="About Me"),
         rx.box(
             create_about_summary(),
@@ -241,18 +215,4 @@ def create_about_section():
                 }
             ),
         ),
-        width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
-        margin_left="auto",
-        margin_right="auto",
-        padding_left="1rem",
-        padding_right="1rem",
     )
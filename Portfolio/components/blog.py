@@ -1,19 +1,83 @@
+from typing import Any
+
 import reflex as rx
 from ..utils.styles import (
     create_styled_heading,
     create_paragraph,
     create_section_heading,
-    create_link_with_icon
+    create_link_with_icon,
+    create_container,
 )
+from ..data.posts import load_posts
+
+# Medium posts baked in by `python -m Portfolio.build medium`; nothing is fetched client-side.
+POSTS = load_posts()
+
+
+# Create a card for one Medium article.
+def create_post_card(post):
+    """Create a card for one Medium article."""
+    return rx.link(
+        rx.vstack(
+            rx.cond(
+                post["thumbnail"],
+                rx.image(
+                    src=post["thumbnail"].to(str),
+                    alt="",
+                    loading="lazy",
+                    width="100%",
+                    height="10rem",
+                    object_fit="cover",
+                    border_radius="0.375rem",
+                ),
+            ),
+            rx.text(post["date"], color="#9CA3AF", font_size="0.875rem"),
+            create_styled_heading(
+                font_size="1.125rem",
+                line_height="1.5rem",
+                heading_text=post["title"],
+            ),
+            create_paragraph(paragraph_text=post["excerpt"], margin_bottom="0"),
+            spacing="2",
+            align_items="start",
+            height="100%",
+        ),
+        href=post["href"].to(str),
+        is_external=True,
+        background_color="#1F2937",
+        padding="1.5rem",
+        border_radius="0.5rem",
+        color="inherit",
+        text_decoration="none",
+    )
+
+
+# Create the grid of Medium article cards.
+def create_post_grid():
+    """Create the grid of Medium article cards."""
+    return rx.box(
+        rx.foreach(
+            rx.Var.create(POSTS).to(list[dict[str, Any]]),
+            create_post_card,
+        ),
+        display="grid",
+        gap="2rem",
+        width="100%",
+        grid_template_columns=rx.breakpoints({
+            "0px": "repeat(1, minmax(0, 1fr))",
+            "768px": "repeat(2, minmax(0, 1fr))",
+            "1024px": "repeat(3, minmax(0, 1fr))",
+        }),
+    )
 
 
 # Create the 'Blog' section linking to Medium profile.
 def create_blog_section():
     """Create the 'Blog' section linking to Medium profile."""
-    return rx.box(
+    return create_container(
         create_section_heading(heading_text="Blog - Articles on Medium"),
         rx.vstack(
-            create_paragraph(
+            create_post_grid() if POSTS else create_paragraph(
                 paragraph_text="Although I haven’t published any articles here yet, I’m gearing up to launch a series on Medium. My work delves into the cutting-edge intersection of Formula 1 and Artificial Intelligence, examining how AI-driven insights can transform race strategies, optimize performance, and elevate the fan experience in this exhilarating sport.",
                 margin_bottom="1rem"  # Added the margin_bottom argument
             ),
@@ -28,19 +92,4 @@ def create_blog_section():
             align_items="start",
             width="100%",
         ),
-        width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
-        margin_left="auto",
-        margin_right="auto",
-        padding_left="1rem",
-        padding_right="1rem",
-        id="blog",  # Add ID if you are going to link from navigation
     )
@@ -1,5 +1,11 @@
 import reflex as rx
-from ..utils.styles import create_styled_heading, create_paragraph, create_section_heading
+from ..utils.styles import (
+    create_container,
+    create_styled_heading,
+    create_paragraph,
+    create_section_heading,
+)
+from ..utils.assets import document_href
 
 # Directly defined constants in the file
 LINKEDIN_URL = "https://www.linkedin.com/in/victorvegasobral/"
@@ -38,7 +44,7 @@ def create_contact_link(link_url, icon_alt, icon_tag, link_text):
 
 def create_contact_section():
     """Create the 'Contact' section with contact information and resume download."""
-    return rx.box(
+    return create_container(
         create_section_heading(heading_text="Contact"),
         rx.box(
             rx.vstack(
@@ -81,7 +87,8 @@ def create_contact_section():
                             },
                             transition="all 0.3s ease-in-out",
                         ),
-                        href="/F1-Strat-Manager.pdf",  # Path to the CV PDF
+                        # Linearized copy written by `python -m Portfolio.build documents`
+                        href=document_href("/F1-Strat-Manager.pdf"),
                         is_external=True,
                         text_decoration="none",
                     ),
@@ -125,21 +132,6 @@ def create_contact_section():
             display="flex",
             justify_content="center",
         ),
-        id="contact",
-        width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
-        margin_left="auto",
-        margin_right="auto",
-        padding_left="1rem",
-        padding_right="1rem",
         padding_top="2rem",
         padding_bottom="2rem",
     )
@@ -1,5 +1,5 @@
 import reflex as rx
-from ..utils.styles import create_text
+from ..utils.styles import create_container, create_text
 
 # Create the footer with copyright information.
 
@@ -7,24 +7,10 @@ from ..utils.styles import create_text
 def create_footer():
     """Create the footer with copyright information."""
     return rx.box(
-        rx.box(
+        create_container(
             create_text(
                 text_content="© 2025 Harim Kang. All rights reserved."
             ),
-            width="100%",
-            style=rx.breakpoints(
-                {
-                    "640px": {"max-width": "640px"},
-                    "768px": {"max-width": "768px"},
-                    "1024px": {"max-width": "1024px"},
-                    "1280px": {"max-width": "1280px"},
-                    "1536px": {"max-width": "1536px"},
-                }
-            ),
-            margin_left="auto",
-            margin_right="auto",
-            padding_left="1rem",
-            padding_right="1rem",
             text_align="center",
         ),
         background_color="#1F2937",
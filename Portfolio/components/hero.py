@@ -1,5 +1,12 @@
 import reflex as rx
-from ..utils.styles import create_paragraph, create_icon
+from ..utils.styles import (
+    SOCIAL_ICON_CLASS,
+    TRANSITION_CLASS,
+    create_container,
+    create_icon,
+    create_paragraph,
+    create_responsive_image,
+)
 
 # Directly defined constants in the file
 LINKEDIN_URL = "https://www.linkedin.com/in/victorvegasobral/"
@@ -18,34 +25,24 @@ def create_social_icon_link(icon_alt, icon_tag, href):
             icon_tag=icon_tag,
             icon_width="1.5rem",
         ),
-        class_name="transform",
+        class_name=f"transform {SOCIAL_ICON_CLASS} {TRANSITION_CLASS}",
         href=href,
         is_external=True,  # Open in a new tab
-        transition_duration="300ms",
-        transition_timing_function="cubic-bezier(0.4, 0, 0.2, 1)",
-        _hover={
-            "transform": "scale(1.1)",
-            "color": "#93C5FD",
-        },
-        color="#60A5FA",
-        transition_property="background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",
     )
 
 
 def create_profile_image():
     """Create a circular profile image with hover effect."""
-    return rx.image(
-        alt=SITE_NAME,  # Use SITE_NAME for alt text
-        class_name="transform",
+    return create_responsive_image(
         src=AVATAR_URL,  # Use the new AVATAR_URL
-        transition_duration="300ms",
-        transition_timing_function="cubic-bezier(0.4, 0, 0.2, 1)",
+        sizes="16rem",
+        alt=SITE_NAME,  # Use SITE_NAME for alt text
+        class_name=f"transform {TRANSITION_CLASS}",
         height="16rem",
         _hover={"transform": "scale(1.05)"},
         margin_right="2rem",
         object_fit="cover",
         border_radius="9999px",
-        transition_property="background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",
         width="16rem",
     )
 
@@ -85,7 +82,7 @@ def create_bio_section():
 
 def create_hero_section():
     """Create the hero section with profile image and bio."""
-    return rx.box(
+    return create_container(
         rx.flex(
             create_profile_image(),
             create_bio_section(),
@@ -97,20 +94,6 @@ def create_hero_section():
             align_items="center",
         ),
         id="home",
-        width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
-        margin_left="auto",
-        margin_right="auto",
-        padding_left="1rem",
-        padding_right="1rem",
         padding_top="4rem",
         padding_bottom="4rem",
     )
@@ -1,5 +1,6 @@
 import reflex as rx
-from ..utils.styles import create_styled_link
+from ..utils.styles import NAV_BRAND_CLASS, TRANSITION_CLASS, create_styled_link
+from ..utils.routing import section_href, use_multi_route
 
 
 def create_list_item_link(link_url, link_text):
@@ -15,21 +16,15 @@ def create_navigation_menu():
     return rx.flex(
         rx.el.a(
             "Víctor Vega",  # Updated name
-            href="#",
-            transition_duration="300ms",
-            transition_timing_function="cubic-bezier(0.4, 0, 0.2, 1)",
-            font_weight="700",
-            _hover={"color": "#60A5FA"},
-            font_size="1.5rem",
-            line_height="2rem",
-            transition_property="background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",
+            href="/" if use_multi_route() else "#",
+            class_name=f"{NAV_BRAND_CLASS} {TRANSITION_CLASS}",
         ),
         rx.list(
-            create_list_item_link(link_url="#home", link_text="Home"),
-            create_list_item_link(link_url="#about", link_text="About Me"),
-            create_list_item_link(link_url="#projects", link_text="Projects"),
-            create_list_item_link(link_url="#blog", link_text="Blog"),
-            create_list_item_link(link_url="#contact", link_text="Contact"),
+            create_list_item_link(link_url=section_href("home"), link_text="Home"),
+            create_list_item_link(link_url=section_href("about"), link_text="About Me"),
+            create_list_item_link(link_url=section_href("projects"), link_text="Projects"),
+            create_list_item_link(link_url=section_href("blog"), link_text="Blog"),
+            create_list_item_link(link_url=section_href("contact"), link_text="Contact"),
             display="flex",
             column_gap="1.5rem",
         ),
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from ..utils.assets import load_manifest, responsive_image_data
+
+# Structured project catalog rendered by components/projects.py.
+CATALOG_PATH = Path(__file__).with_name("projects.json")
+
+# Repository stats keyed by project href, written by `python -m Portfolio.build github`.
+GITHUB_METADATA_PATH = Path(__file__).with_name("github.json")
+
+REQUIRED_FIELDS = ("id", "title", "description", "technologies_used", "href")
+
+# technologies_used is free-form text: "Python, Machine Learning; FastF1".
+TAG_SEPARATOR = re.compile(r"[,;]")
+
+# Projects per bitset word; JavaScript bitwise operators work on 32-bit integers.
+TAG_WORD_BITS = 32
+
+DEFAULT_DETAILS = {
+    "detailed_description": "",
+    "key_features": [],
+    "development_contributions": [],
+    "research_contributions": [],
+    "image": None,
+    "research_image": None,
+}
+
+
+@lru_cache(maxsize=None)
+def read_catalog(path: Path = CATALOG_PATH) -> tuple:
+    """Read and validate the raw project entries from the catalog file."""
+    projects = json.loads(path.read_text(encoding="utf-8"))["projects"]
+    seen = set()
+    for project in projects:
+        missing = [field for field in REQUIRED_FIELDS if not project.get(field)]
+        if missing:
+            raise ValueError(
+                f"Project {project.get('id', '?')} in {path.name} is missing {missing}")
+        if project["id"] in seen:
+            raise ValueError(f"Duplicate project id {project['id']} in {path.name}")
+        seen.add(project["id"])
+    return tuple(projects)
+
+
+def load_projects(path: Path = CATALOG_PATH) -> list:
+    """Return the catalog projects with default details, resolved images and repository stats."""
+    github = load_manifest(GITHUB_METADATA_PATH)
+    projects = []
+    for project in read_catalog(path):
+        details = {**DEFAULT_DETAILS, **project.get("details", {})}
+        details["image"] = responsive_image_data(details["image"])
+        details["research_image"] = responsive_image_data(details["research_image"])
+        projects.append({
+            "link_text": "GitHub Repository ",
+            **project,
+            "details": details,
+            "github": github.get(project["href"]),
+        })
+    return projects
+
+
+def details_payload(details: dict) -> bytes:
+    """Serialize a project's details as the JSON chunk the details stage publishes."""
+    return json.dumps(details, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def details_digest(details: dict) -> str:
+    """Identify a version of a project's details, to tell whether its published chunk is current."""
+    return hashlib.sha256(details_payload(details)).hexdigest()
+
+
+def parse_technologies(value: str) -> list:
+    """Split a technologies_used string into (key, label) pairs; keys are case- and space-insensitive."""
+    tags = {}
+    for label in TAG_SEPARATOR.split(value):
+        label = " ".join(label.split()).rstrip(".")
+        if label:
+            tags.setdefault(label.casefold(), label)
+    return list(tags.items())
+
+
+def build_tag_index(projects) -> dict:
+    """Index the projects' tags as {"tags": [{key, label, count}], "bits": {key: [32-bit words]}}.
+
+    Bit i of a tag's words is set when projects[i] has the tag, so the projects matching
+    several tags are the AND of their words. Each tag is labelled with its most common spelling.
+    """
+    spellings = {}
+    bits = {}
+    for index, project in enumerate(projects):
+        for key, label in parse_technologies(project["technologies_used"]):
+            spellings.setdefault(key, Counter())[label] += 1
+            words = bits.setdefault(key, [0] * -(-len(projects) // TAG_WORD_BITS))
+            words[index // TAG_WORD_BITS] |= 1 << (index % TAG_WORD_BITS)
+    tags = [
+        {
+            "key": key,
+            "label": spellings[key].most_common(1)[0][0],
+            "count": sum(spellings[key].values()),
+        }
+        for key in bits
+    ]
+    # Most used first, then alphabetically.
+    tags.sort(key=lambda tag: (-tag["count"], tag["key"]))
+    return {"tags": tags, "bits": bits}
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+from ..utils.assets import load_manifest
+
+# Medium posts rendered by components/blog.py, written by `python -m Portfolio.build medium`.
+POSTS_PATH = Path(__file__).with_name("posts.json")
+
+
+def load_posts() -> list:
+    """Return the baked Medium posts, newest first, or none before the stage has run."""
+    return load_manifest(POSTS_PATH).get("posts", [])
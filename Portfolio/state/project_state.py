@@ -1,4 +1,14 @@
+from typing import Any
+
+import reflex as rx
 from reflex import State
+from reflex.config import get_config
+from reflex.event import EventChain
+from reflex.experimental.client_state import ClientStateVar
+from reflex.utils.imports import ImportVar
+from reflex.vars import FunctionVar, Var, VarData
+
+from ..utils.memo import memoize_as_one
 
 # State for managing project details visibility.
 
@@ -26,3 +36,317 @@ class ProjectState(State):
     def set_tab(self, tab: str):
         """Set the active tab."""
         self.selected_tab = tab
+
+    @staticmethod
+    def provider(*children, **props):
+        """Wrap the components that read the project state."""
+        # One React component, so the ProjectDetails hooks are declared once for every card.
+        return memoize_as_one(rx.box(*children, **props))
+
+
+# Browser-only twin of ProjectState, used when the site is exported without a backend.
+class ClientProjectState:
+    """Project details visibility kept in React useState, with no backend round-trip."""
+
+    _selected_project = ClientStateVar.create("selected_project", default="")
+    _selected_tab = ClientStateVar.create("selected_tab", default="development")
+
+    # Which project's details are currently shown
+    selected_project = _selected_project.value.to(str)
+
+    # Which tab is selected (development/research)
+    selected_tab = _selected_tab.value.to(str)
+
+    @classmethod
+    def toggle_project(cls, project_id):
+        """Toggle project expansion."""
+        return cls._selected_project.set_value(
+            rx.cond(cls.selected_project == project_id, "", project_id)
+        )
+
+    @classmethod
+    def set_tab(cls, tab):
+        """Set the active tab."""
+        return cls._selected_tab.set_value(tab)
+
+    @classmethod
+    def provider(cls, *children, **props):
+        """Wrap the components that read the project state together with its useState hooks."""
+        # Compile the subtree as one React component: readers memoized on their
+        # own would not re-render when the hooks' setters fire.
+        return memoize_as_one(
+            rx.box(cls._selected_project, cls._selected_tab, *children, **props))
+
+
+# Chunk requests are kept on window, so a remounted grid reuses the ones already made.
+LOAD_PROJECT_DETAILS = """const load_project_details = useCallback((project_id, src) => {
+    // Cards without a chunk carry their details inline.
+    if (!src) {
+      return;
+    }
+    const chunks = (window.__project_details ??= new Map());
+    if (!chunks.has(src)) {
+      chunks.set(src, fetch(src).then((response) => {
+        if (!response.ok) {
+          throw new Error(`${src}: ${response.status}`);
+        }
+        return response.json();
+      }));
+    }
+    chunks.get(src).then(
+      (details) => set_project_details((loaded) => (
+        project_id in loaded ? loaded : {...loaded, [project_id]: details})),
+      // Forget the failed request so the next hover or click retries it.
+      () => chunks.delete(src),
+    );
+  }, [])"""
+
+
+# Project detail panes, fetched from the chunks build/details.py writes instead of shipping in the page.
+class ProjectDetails:
+    """Detail panes loaded on first use and kept in memory; the hooks live in the project state provider."""
+
+    _hooks = VarData(
+        imports={"react": [ImportVar(tag="useState"), ImportVar(tag="useCallback")]},
+        hooks={
+            "const [project_details, set_project_details] = useState({})": None,
+            LOAD_PROJECT_DETAILS: None,
+        },
+    )
+
+    @classmethod
+    def get(cls, project_id, inline) -> Var:
+        """Return a project's details: the inline copy if the card has one, else the loaded chunk,
+        undefined until it arrives."""
+        project_id, inline = Var.create(project_id), Var.create(inline)
+        return Var(
+            _js_expr=f"({inline!s} ?? project_details[{project_id!s}])",
+            _var_data=VarData.merge(
+                project_id._get_all_var_data(), inline._get_all_var_data(), cls._hooks),
+        ).to(dict[str, Any])
+
+    @classmethod
+    def load(cls, project_id, src) -> Var:
+        """Fetch a project's details chunk unless it is already loaded or on its way."""
+        project_id, src = Var.create(project_id), Var.create(src)
+        return Var(
+            _js_expr=f"(() => load_project_details({project_id!s}, {src!s}))",
+            _var_data=VarData.merge(
+                project_id._get_all_var_data(), src._get_all_var_data(), cls._hooks),
+        ).to(FunctionVar, EventChain)
+
+
+# The index is fetched once; queries are only lower-cased, split and filtered the way build/search.py tokenized.
+SEARCH_PROJECTS = """const load_search_index = useCallback((src) => {
+    const indexes = (window.__project_search ??= new Map());
+    if (!indexes.has(src)) {
+      indexes.set(src, fetch(src).then((response) => {
+        if (!response.ok) {
+          throw new Error(`${src}: ${response.status}`);
+        }
+        return response.json();
+      }));
+      indexes.get(src).catch(() => indexes.delete(src));
+    }
+    return indexes.get(src);
+  }, [])
+  const search_projects = useCallback((query, src) => {
+    latest_project_search.current = query;
+    const terms = query.normalize("NFD").replace(/[\\u0300-\\u036f]/g, "").toLowerCase()
+      .split(/[^a-z0-9]+/).filter(Boolean);
+    if (!terms.length) {
+      set_project_search(null);
+      return;
+    }
+    load_search_index(src).then((index) => {
+      if (latest_project_search.current !== query) {
+        return;
+      }
+      // Drop the words the index never holds; every remaining term must match.
+      const indexed = terms.filter(
+        (term) => term.length >= index.min_length && !index.stopwords.includes(term));
+      if (!indexed.length) {
+        set_project_search(null);
+        return;
+      }
+      let ranked = null;
+      for (const term of indexed) {
+        // Binary search for the first indexed term >= term; the terms it prefixes follow it.
+        let low = 0;
+        let high = index.terms.length;
+        while (low < high) {
+          const middle = (low + high) >> 1;
+          if (index.terms[middle] < term) {
+            low = middle + 1;
+          } else {
+            high = middle;
+          }
+        }
+        const scores = new Map();
+        for (let position = low; position < index.terms.length && index.terms[position].startsWith(term); position++) {
+          // An exact term scores double a longer one it only prefixes.
+          const factor = index.terms[position] === term ? 2 : 1;
+          const postings = index.postings[position];
+          for (let offset = 0; offset < postings.length; offset += 2) {
+            const project = postings[offset];
+            scores.set(project, Math.max(scores.get(project) ?? 0, postings[offset + 1] * factor));
+          }
+        }
+        // Every query term must match.
+        ranked = ranked === null ? scores : new Map(
+          [...ranked].filter(([project]) => scores.has(project))
+            .map(([project, score]) => [project, score + scores.get(project)]));
+      }
+      const order = [...ranked].sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+      set_project_search(Object.fromEntries(order.map(([project], rank) => [index.ids[project], rank])));
+    }, () => {});
+  }, [load_search_index])"""
+
+
+# Search over the prebuilt index build/search.py writes; results filter and reorder the cards.
+class ProjectSearch:
+    """Ranked project search, null while the box is empty; the hooks live in the project state provider."""
+
+    _hooks = VarData(
+        imports={"react": [ImportVar(tag="useState"), ImportVar(tag="useCallback"), ImportVar(tag="useRef")]},
+        hooks={
+            "const [project_search, set_project_search] = useState(null)": None,
+            'const latest_project_search = useRef("")': None,
+            SEARCH_PROJECTS: None,
+        },
+    )
+
+    @classmethod
+    def matches(cls, project_id) -> Var:
+        """Check whether a project matches the query; every project does while the box is empty."""
+        project_id = Var.create(project_id)
+        return Var(
+            _js_expr=f"(project_search === null || {project_id!s} in project_search)",
+            _var_data=VarData.merge(project_id._get_all_var_data(), cls._hooks),
+        ).to(bool)
+
+    @classmethod
+    def rank(cls, project_id) -> Var:
+        """Return a project's position in the results, for the CSS order of its card."""
+        project_id = Var.create(project_id)
+        return Var(
+            _js_expr=f"(project_search?.[{project_id!s}] ?? 0)",
+            _var_data=VarData.merge(project_id._get_all_var_data(), cls._hooks),
+        ).to(int)
+
+    @classmethod
+    def search(cls, src) -> Var:
+        """Run the input's value as a query against the index at src."""
+        src = Var.create(src)
+        return Var(
+            _js_expr=f"((event) => search_projects(event.target.value, {src!s}))",
+            _var_data=VarData.merge(src._get_all_var_data(), cls._hooks),
+        ).to(FunctionVar, EventChain)
+
+    @classmethod
+    def prefetch(cls, src) -> Var:
+        """Start fetching the index before the first keystroke."""
+        src = Var.create(src)
+        return Var(
+            _js_expr=f"(() => load_search_index({src!s}))",
+            _var_data=VarData.merge(src._get_all_var_data(), cls._hooks),
+        ).to(FunctionVar, EventChain)
+
+
+# Selected tags hide the other cards through one generated rule, so the hidden cards are not touched.
+FILTER_PROJECT_TAGS = """const toggle_project_tag = useCallback((tag) => set_project_tags((tags) => (
+    tags.includes(tag) ? tags.filter((selected) => selected !== tag) : [...tags, tag])), [])
+  const project_tag_hidden = useCallback((bits, count) => {
+    if (!project_tags.length) {
+      return [];
+    }
+    // The projects carrying every selected tag: the AND of the tags' bitsets, word by word.
+    const mask = Array.from({ length: Math.ceil(count / 32) }, (_, word) => project_tags.reduce(
+      (mask, tag) => mask & (bits[tag]?.[word] ?? 0), -1));
+    const hidden = [];
+    for (let index = 0; index < count; index++) {
+      if (!((mask[index >> 5] >>> (index & 31)) & 1)) {
+        hidden.push(index);
+      }
+    }
+    return hidden;
+  }, [project_tags])
+  const project_tag_css = useCallback((bits, count, selector) => {
+    const hidden = project_tag_hidden(bits, count);
+    return hidden.length
+      ? `${hidden.map((index) => `${selector} > [data-project-index="${index}"]`).join(",")}{display:none}`
+      : "";
+  }, [project_tag_hidden])"""
+
+
+# Technology tag filter over the bitsets data/catalog.py builds from technologies_used.
+class ProjectTags:
+    """Selected tag keys, empty when unfiltered; the hooks live in the project state provider."""
+
+    _hooks = VarData(
+        imports={"react": [ImportVar(tag="useState"), ImportVar(tag="useCallback")]},
+        hooks={
+            "const [project_tags, set_project_tags] = useState([])": None,
+            FILTER_PROJECT_TAGS: None,
+        },
+    )
+
+    # Whether any tag is selected
+    active = Var(_js_expr="(project_tags.length > 0)", _var_data=_hooks).to(bool)
+
+    # Deselect every tag
+    clear = Var(_js_expr="(() => set_project_tags([]))", _var_data=_hooks).to(FunctionVar, EventChain)
+
+    @classmethod
+    def selected(cls, tag) -> Var:
+        """Check whether a tag is selected."""
+        tag = Var.create(tag)
+        return Var(
+            _js_expr=f"project_tags.includes({tag!s})",
+            _var_data=VarData.merge(tag._get_all_var_data(), cls._hooks),
+        ).to(bool)
+
+    @classmethod
+    def toggle(cls, tag) -> Var:
+        """Add a tag to the filter, or remove it if it is selected."""
+        tag = Var.create(tag)
+        return Var(
+            _js_expr=f"(() => toggle_project_tag({tag!s}))",
+            _var_data=VarData.merge(tag._get_all_var_data(), cls._hooks),
+        ).to(FunctionVar, EventChain)
+
+    @classmethod
+    def hidden_css(cls, bits, count, selector: str) -> Var:
+        """Return a rule hiding the cards, marked `data-project-index`, that miss a selected tag."""
+        bits, selector = Var.create(bits), Var.create(selector)
+        return Var(
+            _js_expr=f"project_tag_css({bits!s}, {count}, {selector!s})",
+            _var_data=VarData.merge(bits._get_all_var_data(), cls._hooks),
+        ).to(str)
+
+def no_visible_projects(ids: list, bits, selected_project) -> Var:
+    """Check whether the search and the tag filter together hide every card, ids in catalog order;
+    never while a card is expanded, since the expanded card stays visible."""
+    ids, count = Var.create(ids), len(ids)
+    bits, selected_project = Var.create(bits), Var.create(selected_project)
+    return Var(
+        _js_expr=(
+            f"({selected_project!s} === \"\" && ((hidden) => {count} > 0"
+            f" && {ids!s}.every((id, index) => hidden.has(index)"
+            f" || (project_search !== null && !(id in project_search))))"
+            f"(new Set(project_tag_hidden({bits!s}, {count}))))"
+        ),
+        _var_data=VarData.merge(
+            bits._get_all_var_data(), selected_project._get_all_var_data(),
+            ProjectSearch._hooks, ProjectTags._hooks),
+    ).to(bool)
+
+
+def use_client_state() -> bool:
+    """Check whether the app is built without a websocket, so events must stay client-side."""
+    config = get_config()
+    return bool(getattr(config, "frontend_only", False) or getattr(config, "disable_ws", False))
+
+
+# The project state components should use for this build.
+ActiveProjectState = ClientProjectState if use_client_state() else ProjectState
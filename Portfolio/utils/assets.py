@@ -0,0 +1,127 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+# Directory served as the site root by Reflex.
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+# Manifest written by `python -m Portfolio.build assets`.
+VENDOR_DIR = ASSETS_DIR / "vendor"
+VENDOR_MANIFEST = VENDOR_DIR / "manifest.json"
+
+
+@lru_cache(maxsize=None)
+def load_manifest(manifest_path: Path) -> dict:
+    """Load a build manifest, or an empty one if the stage has not run yet."""
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def asset_src(src: str) -> str:
+    """Return the vendored local path for a remote image, or the src unchanged."""
+    return load_manifest(VENDOR_MANIFEST).get(src, src)
+
+
+# Remote scripts and stylesheets that the assets stage vendors alongside images.
+REMOTE_ASSETS = []
+
+
+def vendored_asset(url: str) -> str:
+    """Register a remote file for vendoring and return its local path once vendored."""
+    if url not in REMOTE_ASSETS:
+        REMOTE_ASSETS.append(url)
+    return asset_src(url)
+
+
+# Manifest written by `python -m Portfolio.build images`.
+IMAGES_DIR = ASSETS_DIR / "img"
+IMAGES_MANIFEST = IMAGES_DIR / "manifest.json"
+
+# Sources rendered through styles.create_responsive_image, in render order.
+RESPONSIVE_SOURCES = []
+
+
+def register_responsive_source(src: str):
+    """Record an image that should get resized variants at build time."""
+    if src and src not in RESPONSIVE_SOURCES:
+        RESPONSIVE_SOURCES.append(src)
+
+
+def image_variants(src: str):
+    """Return the responsive variants generated for an image, if any."""
+    return load_manifest(IMAGES_MANIFEST).get(src)
+
+
+def responsive_image_data(src):
+    """Describe an image as plain data so it can be rendered from a client-side Var."""
+    if not src:
+        return None
+    register_responsive_source(src)
+    variants = image_variants(src)
+    if variants is None:
+        return {"src": asset_src(src), "src_set": "", "sources": [],
+                "width": None, "height": None}
+
+    fallback_type = "image/png" if variants["fallback"].endswith(".png") else "image/jpeg"
+    return {
+        "src": variants["fallback"],
+        "src_set": variants["sources"][fallback_type],
+        "sources": [
+            {"type": mime, "src_set": src_set}
+            for mime, src_set in variants["sources"].items()
+            if mime != fallback_type
+        ],
+        "width": variants["width"],
+        "height": variants["height"],
+    }
+
+
+# Manifest written by `python -m Portfolio.build sprite`.
+ICONS_DIR = ASSETS_DIR / "icons"
+SPRITE_MANIFEST = ICONS_DIR / "manifest.json"
+
+# SVG icons rendered through styles.create_sprite_icon, in render order.
+SPRITE_ICONS = []
+
+
+def register_sprite_icon(src: str):
+    """Record an SVG icon that should be bundled into the sprite at build time."""
+    if src not in SPRITE_ICONS:
+        SPRITE_ICONS.append(src)
+
+
+def sprite_href(src: str):
+    """Return the `<use href>` of an icon bundled into the sprite, if any."""
+    manifest = load_manifest(SPRITE_MANIFEST)
+    symbol_id = manifest.get("icons", {}).get(src)
+    if symbol_id is None:
+        return None
+    return f"{manifest['sprite']}#{symbol_id}"
+
+
+# Manifest written by `python -m Portfolio.build fonts`.
+FONTS_DIR = ASSETS_DIR / "fonts"
+FONTS_MANIFEST = FONTS_DIR / "manifest.json"
+
+
+# Manifest written by `python -m Portfolio.build details`.
+PROJECT_DETAILS_DIR = ASSETS_DIR / "projects"
+PROJECT_DETAILS_MANIFEST = PROJECT_DETAILS_DIR / "manifest.json"
+
+# Manifest written by `python -m Portfolio.build search`.
+SEARCH_DIR = ASSETS_DIR / "search"
+SEARCH_MANIFEST = SEARCH_DIR / "manifest.json"
+
+
+# Source PDFs, kept outside assets/ so only their optimized copies are published.
+DOCUMENT_SOURCES_DIR = ASSETS_DIR.parent / "documents"
+
+# Manifest written by `python -m Portfolio.build documents`.
+DOCUMENTS_DIR = ASSETS_DIR / "docs"
+DOCUMENTS_MANIFEST = DOCUMENTS_DIR / "manifest.json"
+
+
+def document_href(href: str) -> str:
+    """Return the optimized, content-hashed copy of a document link, or the href unchanged."""
+    return load_manifest(DOCUMENTS_MANIFEST).get(href, href)
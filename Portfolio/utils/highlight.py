@@ -0,0 +1,62 @@
+import html
+import re
+
+# Keywords coloured across the site, mapped to their text colour.
+KEYWORD_COLORS = {
+    "Python": "rgb(96, 165, 250)",
+    "PyTorch": "rgb(239, 68, 68)",
+    "TensorFlow": "rgb(255, 128, 0)",
+    "Deep Learning": "rgb(139, 92, 246)",
+    "AI": "rgb(0, 150, 150)",
+    "Intelligent Systems Engineering": "rgb(45, 155, 245)",
+    "Engineering Summer Programme alumnus at Girton College, Cambridge University": "rgb(0, 84, 166)",
+    "IELTS 8": "rgb(0, 84, 166)",
+    "F1": "rgb(255, 0, 0)",
+}
+
+SPAN_TEMPLATE = '<span style="color: {color}; font-weight: 600;">{keyword}</span>'
+
+
+class KeywordHighlighter:
+    """Wrap keywords in coloured spans with one compiled regex and a single pass."""
+
+    def __init__(self, keyword_colors: dict):
+        # Keys are escaped exactly like the text, so every match finds its span.
+        self.spans = {
+            html.escape(keyword, quote=False): SPAN_TEMPLATE.format(
+                color=color, keyword=html.escape(keyword, quote=False))
+            for keyword, color in keyword_colors.items()
+        }
+        # Group keywords by first character, longest first so phrases win over
+        # the words inside them. Starting every branch with a literal lets the
+        # regex engine skip ahead to candidate characters instead of trying
+        # each keyword at every position.
+        branches = {}
+        for keyword in sorted(self.spans, key=len, reverse=True):
+            branches.setdefault(keyword[0], []).append(re.escape(keyword[1:]))
+        # Whole words only: "AI" must not match inside "DeepLearning.AI".
+        # The lookbehind runs after the first character, hence its width of two.
+        # The one capturing group makes split() return the keywords at odd indexes.
+        self.pattern = re.compile(
+            "((?:"
+            + "|".join(
+                re.escape(first) + r"(?<![\w.].)(?:" + "|".join(rests) + ")"
+                for first, rests in branches.items()
+            )
+            + r"))(?!\w)"
+        )
+
+    def highlight(self, text: str) -> str:
+        """Escape the text and colour every keyword; emitted spans are never rescanned."""
+        parts = self.pattern.split(html.escape(text, quote=False))
+        # A C-level dict lookup per keyword instead of a Python callback per match.
+        parts[1::2] = map(self.spans.__getitem__, parts[1::2])
+        return "".join(parts)
+
+
+DEFAULT_HIGHLIGHTER = KeywordHighlighter(KEYWORD_COLORS)
+
+
+def highlight_text(text: str) -> str:
+    """Add color spans to highlighted keywords."""
+    return DEFAULT_HIGHLIGHTER.highlight(text)
@@ -0,0 +1,89 @@
+import os
+
+import reflex as rx
+from reflex.components.component import Component
+from reflex.utils.format import format_ref
+from reflex.utils.imports import ImportVar
+from reflex.vars import Var, VarData
+
+from .memo import memoize_as_one
+
+# Mount a section once it is this close to the viewport, so it is ready before it scrolls in.
+LAZY_ROOT_MARGIN = "600px 0px"
+
+# Set to 1 when exporting to prerender every section into the static HTML, so
+# readers without JavaScript and crawlers get the full page before hydration.
+PRERENDER_ENV = "PORTFOLIO_PRERENDER"
+
+LAZY_SECTION_HOOK = """useEffect(() => {
+  const element = %(ref)s.current;
+  if (%(visible)s || !element) return;
+  if (!("IntersectionObserver" in window)) {
+    %(setter)s(true);
+    return;
+  }
+  const observer = new IntersectionObserver((entries) => {
+    if (entries.some((entry) => entry.isIntersecting)) {
+      %(setter)s(true);
+      observer.disconnect();
+    }
+  }, { rootMargin: "%(margin)s" });
+  observer.observe(element);
+  return () => observer.disconnect();
+}, [%(visible)s])"""
+
+
+def use_prerender() -> bool:
+    """Check whether sections are rendered into the static HTML instead of mounting near the viewport."""
+    return os.environ.get(PRERENDER_ENV, "").lower() in ("1", "true", "yes")
+
+
+class Suspense(Component):
+    """React Suspense boundary; React hydrates each prerendered boundary as its own unit of work."""
+
+    library = "react"
+
+    tag = "Suspense"
+
+
+# Track whether a section has come near the viewport.
+def section_visible_var(section_id: str) -> Var:
+    """Track whether a section has come near the viewport."""
+    ref = format_ref(section_id)
+    visible = f"{ref}_visible"
+    setter = f"set_{visible}"
+    return Var(
+        _js_expr=visible,
+        _var_data=VarData(
+            imports={"react": [ImportVar(tag="useEffect"), ImportVar(tag="useState")]},
+            hooks={
+                # Prerendered sections start visible so hydration matches the static HTML.
+                f"const [{visible}, {setter}] = useState({str(use_prerender()).lower()})": None,
+                LAZY_SECTION_HOOK % {
+                    "ref": ref,
+                    "visible": visible,
+                    "setter": setter,
+                    "margin": LAZY_ROOT_MARGIN,
+                }: None,
+            },
+        ),
+    ).to(bool)
+
+
+# Defer a below-the-fold section until the reader scrolls near it.
+def create_lazy_section(*children, section_id: str, placeholder_height: str, **props):
+    """Render a fixed-height placeholder that mounts the section, and its images, near the viewport."""
+    if use_prerender():
+        # Already in the HTML: hydrate it without blocking the sections above it.
+        children = (Suspense.create(*children),)
+    # The observer hook and the cond reading its state must share one React component.
+    return memoize_as_one(rx.box(
+        rx.cond(
+            section_visible_var(section_id),
+            rx.fragment(*children),
+            # Reserve roughly the section's height so anchors and the scrollbar stay stable.
+            rx.box(height=placeholder_height),
+        ),
+        id=section_id,
+        **props,
+    ))
@@ -0,0 +1,14 @@
+from reflex.components.component import Component, MemoizationDisposition, MemoizationMode
+
+# Passing disposition to MemoizationMode(...) stores the plain string "always", which
+# StatefulComponent.create never matches; copy(update=...) keeps the enum, as Reflex's
+# own MemoizationLeaf does.
+SINGLE_COMPONENT = MemoizationMode(recursive=False).copy(
+    update={"disposition": MemoizationDisposition.ALWAYS})
+
+
+def memoize_as_one(component: Component) -> Component:
+    """Compile a subtree as one memoized React component outside the page component, so the
+    hooks its vars declare re-render that subtree only."""
+    component._memoization_mode = SINGLE_COMPONENT
+    return component
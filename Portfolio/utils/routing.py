@@ -0,0 +1,27 @@
+import os
+
+# Set to 1 to serve About, Projects, Blog and Contact as their own routes, each
+# with its own JS chunk, instead of as anchors on the single page.
+MULTI_ROUTE_ENV = "PORTFOLIO_MULTI_ROUTE"
+
+
+def use_multi_route() -> bool:
+    """Check whether the sections are built as separate pages."""
+    return os.environ.get(MULTI_ROUTE_ENV, "").lower() in ("1", "true", "yes")
+
+
+# Set to 1 while editing content to import each section below the hero from its
+# cached module in .web/utils/sections (see build/incremental.py).
+INCREMENTAL_ENV = "PORTFOLIO_INCREMENTAL"
+
+
+def use_incremental() -> bool:
+    """Check whether sections are compiled into their own cached modules."""
+    return os.environ.get(INCREMENTAL_ENV, "").lower() in ("1", "true", "yes")
+
+
+def section_href(section_id: str) -> str:
+    """Link to a section: its own route in multi-route mode, its anchor otherwise."""
+    if not use_multi_route():
+        return f"#{section_id}"
+    return "/" if section_id == "home" else f"/{section_id}"
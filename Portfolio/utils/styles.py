@@ -1,5 +1,21 @@
+import json
+
 import reflex as rx
 from enum import Enum
+from urllib.parse import urlsplit
+from reflex.components.el.elements.base import BaseHTML
+from reflex.components.next.link import NextLink
+from reflex.vars import Var
+from .assets import (
+    FONTS_MANIFEST,
+    asset_src,
+    image_variants,
+    load_manifest,
+    register_responsive_source,
+    register_sprite_icon,
+    sprite_href,
+    vendored_asset,
+)
 
 # Main colors of the application.
 
@@ -48,6 +64,11 @@ class Font(Enum):
 # Maximum width for containers.
 MAX_WIDTH = "1200px"
 
+# Tailwind's `container` sets width: 100% and a max-width at each breakpoint
+# (640px, 768px, 1024px, 1280px, 1536px). Tailwind compiles it once into the
+# site stylesheet at build time instead of a per-component Emotion style.
+CONTAINER_CLASS = "container mx-auto px-4"
+
 
 # Sizes.
 class Size(Enum):
@@ -72,10 +93,48 @@ class FontSize(Enum):
     LOGO = "28px"
 
 
-# Stylesheets for fonts.
-STYLESHEETS = [
-    "https://fonts.googleapis.com/css2?family=Exo+2:wght@400;700&family=Inter:wght@400;500;700&display=swap",
-]
+# Weights of each Font family that `python -m Portfolio.build fonts` self-hosts.
+FONT_WEIGHTS = {
+    Font.DEFAULT: (400, 500, 700),
+    Font.TITLE: (400, 700),
+}
+
+# Faces the hero paints with; preloaded so the first paint does not wait to discover them.
+PRELOADED_FONTS = ((Font.TITLE, 700), (Font.DEFAULT, 400))
+
+
+def font_family(font: Font) -> str:
+    """Return the webfont family a Font stack starts with, e.g. "Exo 2"."""
+    return font.value.split(",")[0].strip(" '\"")
+
+
+def font_stylesheets() -> list:
+    """Return the self-hosted @font-face stylesheet once the fonts stage has written it."""
+    stylesheet = load_manifest(FONTS_MANIFEST).get("stylesheet")
+    return [stylesheet] if stylesheet else []
+
+
+def font_preloads() -> list:
+    """Create <link rel="preload"> hints for the self-hosted faces in PRELOADED_FONTS."""
+    # Faces are listed widest coverage first, so the first match is the main subset.
+    sources = {}
+    for face in load_manifest(FONTS_MANIFEST).get("faces", []):
+        sources.setdefault((face["family"], face["weight"]), face["src"])
+    preloaded = dict.fromkeys(
+        sources[key] for key in ((font_family(font), weight) for font, weight in PRELOADED_FONTS)
+        if key in sources
+    )
+    return [
+        rx.el.link(
+            rel="preload",
+            href=src,
+            type="font/woff2",
+            cross_origin="",
+            custom_attrs={"as": "font"},
+        )
+        for src in preloaded
+    ]
+
 
 # Base style for the application.
 BASE_STYLE = {
@@ -123,22 +182,119 @@ BASE_STYLE = {
     }
 }
 
+# Static classes used by the helpers below. `python -m Portfolio.build css`
+# compiles them into STATIC_STYLESHEET, which is committed, so they ship as a
+# cached stylesheet instead of Emotion styles in the JS bundle.
+TRANSITION_CLASS = "smooth-transition"
+LINK_CLASS = "styled-link"
+SOCIAL_ICON_CLASS = "social-icon-link"
+NAV_BRAND_CLASS = "nav-brand"
+
+STATIC_CLASSES = {
+    TRANSITION_CLASS: {
+        "transition_property": "background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",
+        "transition_timing_function": "cubic-bezier(0.4, 0, 0.2, 1)",
+        "transition_duration": "300ms",
+    },
+    LINK_CLASS: {
+        "color": TextColor.SECONDARY.value,
+        "_hover": {"color": TextColor.ACCENT.value},
+    },
+    SOCIAL_ICON_CLASS: {
+        "color": "#60A5FA",
+        "_hover": {"transform": "scale(1.1)", "color": "#93C5FD"},
+    },
+    NAV_BRAND_CLASS: {
+        "font_weight": "700",
+        "font_size": "1.5rem",
+        "line_height": "2rem",
+        "_hover": {"color": "#60A5FA"},
+    },
+}
+
+
+# Public path of the compiled STATIC_CLASSES.
+STATIC_STYLESHEET = "/css/static.css"
+
+
+def static_stylesheets() -> list:
+    """Return the compiled STATIC_CLASSES stylesheet; it is committed, so a fresh clone has it."""
+    return [STATIC_STYLESHEET]
+
 
 def load_script(script_source):
     """Load a script from the given source URL."""
     return rx.script(src=script_source)
 
 
+# Animate On Scroll, driven by the data-aos attributes on the sections.
+AOS_SCRIPT_URL = "https://unpkg.com/aos@2.3.4/dist/aos.js"
+AOS_STYLESHEET_URL = "https://unpkg.com/aos@2.3.4/dist/aos.css"
+
+# Loads AOS off the critical path. Elements already on screen at that point were
+# painted without animation, so their data-aos is dropped instead of hiding them
+# again; reduced-motion users never download AOS at all.
+AOS_LOADER = """
+(function () {
+  if (window.matchMedia("(prefers-reduced-motion: reduce)").matches) return;
+  var pending = Array.prototype.filter.call(
+    document.querySelectorAll("[data-aos]"),
+    function (el) {
+      var box = el.getBoundingClientRect();
+      if (box.top < window.innerHeight && box.bottom > 0) {
+        el.removeAttribute("data-aos");
+        return false;
+      }
+      return true;
+    }
+  );
+  if (!pending.length) return;
+  var link = document.createElement("link");
+  link.rel = "stylesheet";
+  link.href = %(stylesheet)s;
+  document.head.appendChild(link);
+  var script = document.createElement("script");
+  script.src = %(script)s;
+  script.async = true;
+  script.onload = function () { window.AOS.init({ once: true }); };
+  document.head.appendChild(script);
+})();
+"""
+
+
+def load_animations():
+    """Load AOS once the page is idle (Next.js lazyOnload), never for reduced motion."""
+    return rx.script(
+        AOS_LOADER % {
+            "stylesheet": json.dumps(vendored_asset(AOS_STYLESHEET_URL)),
+            "script": json.dumps(vendored_asset(AOS_SCRIPT_URL)),
+        },
+        strategy="lazyOnload",
+    )
+
+
+def create_container(*children, class_name: str = "", **props):
+    """Create a centered container whose max width follows the breakpoints."""
+    return rx.box(
+        *children,
+        class_name=f"{CONTAINER_CLASS} {class_name}".strip(),
+        **props,
+    )
+
+
 def create_styled_link(link_url, link_content):
     """Create a styled anchor element with hover effects and transitions."""
+    if link_url.startswith("/"):
+        # Next.js links prefetch the target route's chunk when visible or hovered.
+        return NextLink.create(
+            link_content,
+            href=link_url,
+            class_name=f"{LINK_CLASS} {TRANSITION_CLASS}",
+        )
     return rx.el.a(
         link_content,
         href=link_url,
-        transition_duration="300ms",
-        transition_timing_function="cubic-bezier(0.4, 0, 0.2, 1)",
-        color=TextColor.SECONDARY.value,  # Usar TextColor
-        _hover={"color": TextColor.ACCENT.value},  # Usar TextColor
-        transition_property="background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",
+        class_name=f"{LINK_CLASS} {TRANSITION_CLASS}",
     )
 
 
@@ -184,6 +340,81 @@ def create_icon(alt_text, icon_height, icon_tag, icon_width):
     )
 
 
+def create_responsive_image(src, sizes, **props):
+    """Create an image served as AVIF/WebP/JPEG variants with srcset and intrinsic size."""
+    register_responsive_source(src)
+    variants = image_variants(src)
+    if variants is None:
+        return rx.image(src=asset_src(src), **props)
+
+    fallback_type = "image/png" if variants["fallback"].endswith(".png") else "image/jpeg"
+    return rx.el.picture(
+        *[
+            rx.el.source(type=mime, src_set=src_set, sizes=sizes)
+            for mime, src_set in variants["sources"].items()
+            if mime != fallback_type
+        ],
+        rx.image(
+            src=variants["fallback"],
+            src_set=variants["sources"][fallback_type],
+            sizes=sizes,
+            custom_attrs={
+                "width": variants["width"],
+                "height": variants["height"],
+            },
+            **props,
+        ),
+        display="contents",
+    )
+
+
+def create_catalog_image(image, sizes, **props):
+    """Create a responsive image from catalog data produced by assets.responsive_image_data."""
+    return rx.el.picture(
+        rx.foreach(
+            image["sources"].to(list[dict[str, str]]),
+            lambda source: rx.el.source(
+                type=source["type"].to(str),
+                src_set=source["src_set"].to(str),
+                sizes=sizes,
+            ),
+        ),
+        rx.image(
+            src=image["src"].to(str),
+            src_set=image["src_set"].to(str),
+            sizes=sizes,
+            custom_attrs={"width": image["width"], "height": image["height"]},
+            **props,
+        ),
+        display="contents",
+    )
+
+
+class SvgUse(BaseHTML):
+    """The SVG use element, which rx.el does not provide."""
+
+    tag = "use"
+
+    # The symbol to draw, such as /icons/sprite.<hash>.svg#python-original.
+    href: Var[str]
+
+
+def create_sprite_icon(src, alt, size="1.5rem"):
+    """Draw an SVG icon from the shared sprite, or load it as an image until the sprite is built."""
+    if urlsplit(src).path.endswith(".svg"):
+        register_sprite_icon(src)
+    href = sprite_href(src)
+    if href is None:
+        return rx.image(src=asset_src(src), height=size, width=size,
+                        object_fit="contain", alt=alt)
+    return rx.el.svg(
+        SvgUse.create(href=href),
+        role="img",
+        custom_attrs={"aria-label": alt},
+        style={"width": size, "height": size, "flex_shrink": "0"},
+    )
+
+
 def create_section_heading(heading_text: str, text_align: str = "left"):
     """Create a section heading with fade-in animation."""
     return rx.heading(
@@ -212,9 +443,5 @@ def create_link_with_icon(link_text, icon_alt, icon_tag, href, is_external: bool
         ),
         href=href,
         is_external=is_external,  # Añadido el argumento is_external
-        transition_duration="300ms",
-        transition_timing_function="cubic-bezier(0.4, 0, 0.2, 1)",
-        _hover={"color": TextColor.ACCENT.value},  # Usar TextColor
-        color=TextColor.SECONDARY.value,  # Usar TextColor
-        transition_property="background-color, border-color, color, fill, stroke, opacity, box-shadow, transform",
+        class_name=f"{LINK_CLASS} {TRANSITION_CLASS}",
     )
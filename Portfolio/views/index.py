@@ -6,63 +6,87 @@ from ..components.projects import create_projects_section
 from ..components.blog import create_blog_section
 from ..components.contact import create_contact_section
 from ..components.footer import create_footer
-from ..utils.styles import load_script
+from ..utils.styles import create_container, load_animations
+from ..utils.lazy import create_lazy_section
+from ..utils.routing import use_multi_route
 
+# Sections below the hero, keyed by anchor id and route: the function building
+# each one, the height reserved until it mounts, and its wrapper style.
+SECTIONS = {
+    "about": {
+        "create": create_about_section,
+        "placeholder_height": "80rem",
+        "style": {"background_color": "#1F2937", "padding_top": "4rem", "padding_bottom": "4rem"},
+    },
+    "projects": {
+        "create": create_projects_section,
+        "placeholder_height": "40rem",
+        "style": {"padding_top": "4rem", "padding_bottom": "4rem"},
+    },
+    "blog": {
+        "create": create_blog_section,
+        "placeholder_height": "14rem",
+        "style": {"padding_top": "4rem", "padding_bottom": "4rem"},
+    },
+    "contact": {
+        "create": create_contact_section,
+        "placeholder_height": "36rem",
+        "style": {"background_color": "#1F2937", "padding_top": "1rem", "padding_bottom": "1rem"},
+    },
+}
 
-# Create the main content of the page, including all sections.
-def create_main_content():
+
+# Build a section inline; Portfolio.py passes build.incremental.section_module instead in incremental mode.
+def create_section(section_id, create):
+    """Build a section inline."""
+    return create()
+
+
+# Create the main content of the page; sections below the hero mount as they near the viewport.
+def create_main_content(build_section=create_section):
     """Create the main content of the page, including all sections."""
     return rx.box(
         create_hero_section(),
-        rx.box(
-            create_about_section(),
-            id="about",
-            background_color="#1F2937",
-            padding_top="4rem",
-            padding_bottom="4rem",
-        ),
-        create_projects_section(),
-        rx.box(
-            create_blog_section(),
-            id="blog",
-            padding_top="4rem",
-            padding_bottom="4rem",
-        ),
-        rx.box(
-            create_contact_section(),
-            id="contact",
-            background_color="#1F2937",
-            padding_top="1rem",
-            padding_bottom="1rem",
-        ),
+        *[
+            create_lazy_section(
+                build_section(section_id, section["create"]),
+                section_id=section_id,
+                placeholder_height=section["placeholder_height"],
+                **section["style"],
+            )
+            for section_id, section in SECTIONS.items()
+        ],
     )
 
 
-# Render the complete portfolio page with all necessary scripts and styles.
-def index() -> rx.Component:
-    """Render the complete portfolio page with all necessary scripts and styles."""
+# Wrap page content with the navigation, scripts and page-wide styles.
+def create_page(*content) -> rx.Component:
+    """Wrap page content with the navigation, scripts and page-wide styles."""
     return rx.box(
-        rx.box(
+        create_container(
             create_navigation_menu(),
-            width="100%",
-            style=rx.breakpoints(
-                {
-                    "640px": {"max-width": "640px"},
-                    "768px": {"max-width": "768px"},
-                    "1024px": {"max-width": "1024px"},
-                    "1280px": {"max-width": "1280px"},
-                    "1536px": {"max-width": "1536px"},
-                }
-            ),
-            margin_left="auto",
-            margin_right="auto",
-            padding_left="1rem",
-            padding_right="1rem",
             padding_top="2rem",
             padding_bottom="2rem",
         ),
-        create_main_content(),
+        *content,
+        load_animations(),
         background_color="#111827",
         font_family='system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, "Noto Sans", sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol", "Noto Color Emoji"',
         color="#F3F4F6",
     )
+
+
+# Render one section as its own page in the multi-route layout.
+def create_section_page(section_id: str) -> rx.Component:
+    """Render one section as its own page in the multi-route layout."""
+    section = SECTIONS[section_id]
+    return create_page(rx.box(section["create"](), id=section_id, **section["style"]))
+
+
+# Render the complete portfolio page with all necessary scripts and styles.
+def index(build_section=create_section) -> rx.Component:
+    """Render the complete portfolio page with all necessary scripts and styles."""
+    if use_multi_route():
+        # The landing route only ships the hero; each section has its own chunk.
+        return create_page(create_hero_section())
+    return create_page(create_main_content(build_section))
@@ -0,0 +1,149 @@
+"""Page-build benchmarks: component-tree construction and the full Reflex compile.
+
+Run from the repository root with `python -m benchmarks.build`. Each run is
+appended to .benchmarks/build.json and compared with the median of the recent
+runs there; the exit status is 1 when a benchmark slowed down by more than
+--threshold.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+from reflex import constants
+
+from Portfolio.build.common import ROOT_DIR, load_app_offline
+
+from .highlight import BIO
+
+HISTORY_PATH = ROOT_DIR / ".benchmarks" / "build.json"
+
+# Runs kept in the history file.
+HISTORY_LENGTH = 50
+
+
+def construction_cases() -> dict:
+    """The component-construction functions timed on every run, by name."""
+    from Portfolio.components.about import create_about_section
+    from Portfolio.components.projects import create_projects_section
+    from Portfolio.utils.highlight import highlight_text
+    from Portfolio.views.index import index
+
+    return {
+        "index": index,
+        "create_projects_section": create_projects_section,
+        "create_about_section": create_about_section,
+        "highlight_text[bio]": lambda: highlight_text(BIO),
+        "highlight_text[bio x100]": lambda: highlight_text(BIO * 100),
+    }
+
+
+def compile_case():
+    """Return a callable that compiles Portfolio.app into .web without touching the network."""
+    app = load_app_offline()
+    return lambda: app._compile(export=True)
+
+
+def measure(func, repeat: int, number: int = None) -> dict:
+    """Time a callable after one warm-up call, returning seconds per call."""
+    func()
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    samples = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "number": number,
+        "samples": samples,
+    }
+
+
+def baseline(history: list, window: int) -> dict:
+    """Median of each benchmark's median over the last `window` runs."""
+    medians = {}
+    for run in history[-window:]:
+        for name, result in run["results"].items():
+            medians.setdefault(name, []).append(result["median"])
+    return {name: statistics.median(values) for name, values in medians.items()}
+
+
+def report(results: dict, previous: dict, threshold: float) -> list:
+    """Print the comparison table and return the names of the regressed benchmarks."""
+    regressions = []
+    print(f"{'benchmark':<28} {'median':>11} {'baseline':>11} {'change':>8}")
+    for name, result in results.items():
+        median = result["median"]
+        line = f"{name:<28} {median * 1e3:>9.3f}ms"
+        if name in previous:
+            change = median / previous[name] - 1
+            line += f" {previous[name] * 1e3:>9.3f}ms {change:>+7.1%}"
+            if change > threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def load_history(path: Path) -> list:
+    """Load previous runs, oldest first."""
+    if not path.exists():
+        return []
+    return json.loads(path.read_text(encoding="utf-8"))["runs"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.build")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-compile", action="store_true",
+                        help="Only time component construction.")
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    parser.add_argument("--window", type=int, default=5,
+                        help="Compare with the median of this many previous runs.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing, as a fraction (0.25 = 25%%).")
+    parser.add_argument("--output", type=Path, help="Also write this run's results here.")
+    parser.add_argument("--no-save", action="store_true",
+                        help="Compare without appending the run to the history.")
+    args = parser.parse_args()
+
+    results = {
+        name: measure(func, args.repeat)
+        for name, func in construction_cases().items()
+    }
+    if not args.no_compile:
+        # A compile takes long enough that autoranging would only multiply the wait.
+        results["compile"] = measure(compile_case(), args.repeat, number=1)
+
+    history = load_history(args.history)
+    regressions = report(results, baseline(history, args.window), args.threshold)
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "reflex": constants.Reflex.VERSION,
+        "machine": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(run, indent=2) + "\n", encoding="utf-8")
+    if not args.no_save:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        args.history.write_text(
+            json.dumps({"runs": (history + [run])[-HISTORY_LENGTH:]}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline by more than "
+              f"{args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Micro-benchmark: single-pass KeywordHighlighter vs the old str.replace loop.
+
+The single pass also HTML-escapes the text and checks word boundaries; it splits
+on the keywords and maps them to spans without a Python callback per match.
+Run from the repository root with `python -m benchmarks.highlight`.
+"""
+import argparse
+import timeit
+
+from Portfolio.utils.highlight import KEYWORD_COLORS, SPAN_TEMPLATE, highlight_text
+
+BIO = (
+    "4th-year Intelligent Systems Engineering student at UIE Coruña, Engineering Summer "
+    "Programme alumnus at Girton College, Cambridge University (2023), and Deep Learning "
+    "Specialization by DeepLearning.AI. Passionate about applying AI (Deep Learning, NLP, "
+    "expert systems, predictive modeling) to optimize F1 race strategies with Python, "
+    "PyTorch and TensorFlow. "
+)
+
+
+def replace_loop(text: str) -> str:
+    """The previous implementation: one str.replace rescan per keyword."""
+    for keyword, color in KEYWORD_COLORS.items():
+        text = text.replace(keyword, SPAN_TEMPLATE.format(color=color, keyword=keyword))
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.highlight")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'bio size':>10} {'replace loop':>14} {'single pass':>14} {'speedup':>8}")
+    for copies in (1, 10, 100, 1000):
+        text = BIO * copies
+        number = max(1, 2000 // copies)
+        old = min(timeit.repeat(lambda: replace_loop(text), number=number, repeat=args.repeat))
+        new = min(timeit.repeat(lambda: highlight_text(text), number=number, repeat=args.repeat))
+        print(
+            f"{len(text):>9}c {old / number * 1e6:>12.1f}us "
+            f"{new / number * 1e6:>12.1f}us {old / new:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
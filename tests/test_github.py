@@ -0,0 +1,152 @@
+"""GitHubClient and the github stage against a local mock of the REST API."""
+import json
+import threading
+import urllib.error
+from argparse import Namespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from Portfolio.build import github
+
+REPO_HREF = "https://github.com/octo/demo"
+
+RESPONSES = {
+    "/repos/octo/demo": {"stargazers_count": 42, "pushed_at": "2024-05-01T10:00:00Z"},
+    "/repos/octo/demo/commits": [{"commit": {"committer": {"date": "2024-06-02T08:30:00Z"}}}],
+    "/repos/octo/demo/languages": {"Python": 750, "Jupyter Notebook": 250},
+}
+
+
+class MockGitHub(BaseHTTPRequestHandler):
+    """Serve RESPONSES with a fixed ETag; `status` forces an error for every request."""
+
+    etag = '"v1"'
+    status = 200
+    requests = []
+
+    def do_GET(self):
+        path = self.path.partition("?")[0]
+        type(self).requests.append((path, self.headers.get("If-None-Match")))
+        if self.status != 200:
+            self.send_response(self.status)
+            self.send_header("X-RateLimit-Remaining", "0")
+            self.end_headers()
+            self.wfile.write(b'{"message": "API rate limit exceeded"}')
+            return
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        body = json.dumps(RESPONSES[path]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """Start the mock API and keep the response cache in a temporary directory."""
+    monkeypatch.setattr(github, "CACHE_DIR", tmp_path / "cache")
+    handler = type("Handler", (MockGitHub,), {"requests": [], "status": 200})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield handler, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def age_cache(path, seconds):
+    """Pretend a cached response was fetched `seconds` ago."""
+    cache_file = github.cache_path(path)
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    cached["fetched_at"] -= seconds
+    cache_file.write_text(json.dumps(cached), encoding="utf-8")
+
+
+def test_fresh_cache_is_used_without_a_request(api):
+    handler, url = api
+    client = github.GitHubClient(url, ttl=3600)
+    assert client.get("/repos/octo/demo")["stargazers_count"] == 42
+    assert client.get("/repos/octo/demo")["stargazers_count"] == 42
+    assert handler.requests == [("/repos/octo/demo", None)]
+
+
+def test_expired_cache_is_revalidated_with_its_etag(api):
+    handler, url = api
+    client = github.GitHubClient(url, ttl=3600)
+    client.get("/repos/octo/demo")
+    age_cache(url + "/repos/octo/demo", 3601)
+
+    # 304 Not Modified: the cached body is reused and its TTL starts over.
+    assert client.get("/repos/octo/demo")["stargazers_count"] == 42
+    assert handler.requests[-1] == ("/repos/octo/demo", '"v1"')
+    client.get("/repos/octo/demo")
+    assert len(handler.requests) == 2
+
+
+def test_changed_etag_replaces_the_cached_body(api, monkeypatch):
+    handler, url = api
+    client = github.GitHubClient(url, ttl=0)
+    client.get("/repos/octo/demo")
+    monkeypatch.setattr(handler, "etag", '"v2"')
+    monkeypatch.setitem(RESPONSES, "/repos/octo/demo", {"stargazers_count": 43, "pushed_at": ""})
+
+    assert client.get("/repos/octo/demo")["stargazers_count"] == 43
+    cached = json.loads(github.cache_path(url + "/repos/octo/demo").read_text(encoding="utf-8"))
+    assert cached["etag"] == '"v2"'
+
+
+def test_http_errors_are_raised(api):
+    handler, url = api
+    handler.status = 500
+    with pytest.raises(urllib.error.HTTPError):
+        github.GitHubClient(url).get("/repos/octo/demo")
+
+
+def test_fixtures_replay_without_the_network(tmp_path):
+    fixture = tmp_path / "api.github.com" / "repos" / "octo" / "demo" / "languages.json"
+    fixture.parent.mkdir(parents=True)
+    fixture.write_text(json.dumps(RESPONSES["/repos/octo/demo/languages"]), encoding="utf-8")
+    client = github.GitHubClient(fixtures_dir=tmp_path)
+    assert github.language_mix(client.get("/repos/octo/demo/languages")) == (
+        "Python 75%, Jupyter Notebook 25%"
+    )
+
+
+def run_stage(url, tmp_path, monkeypatch):
+    """Run the github stage for one catalog project, writing its metadata under tmp_path."""
+    metadata_path = tmp_path / "github.json"
+    monkeypatch.setattr(github, "GITHUB_METADATA_PATH", metadata_path)
+    monkeypatch.setattr(github, "read_catalog", lambda: [{"href": REPO_HREF}])
+    status = github.run(Namespace(api_url=url, fixtures=None, ttl=0))
+    return status, json.loads(metadata_path.read_text(encoding="utf-8"))
+
+
+def test_stage_bakes_repository_metadata(api, tmp_path, monkeypatch):
+    _, url = api
+    status, metadata = run_stage(url, tmp_path, monkeypatch)
+    assert status == 0
+    assert metadata[REPO_HREF] == {
+        "stars": 42,
+        "last_commit": "2024-06-02",
+        "language_mix": "Python 75%, Jupyter Notebook 25%",
+    }
+
+
+def test_rate_limited_stage_keeps_the_previous_metadata(api, tmp_path, monkeypatch, capsys):
+    handler, url = api
+    run_stage(url, tmp_path, monkeypatch)
+    handler.status = 403
+
+    status, metadata = run_stage(url, tmp_path, monkeypatch)
+    assert status == 1
+    assert metadata[REPO_HREF]["stars"] == 42
+    assert "Could not fetch octo/demo" in capsys.readouterr().err